@@ -7,7 +7,10 @@ from validation_infrastructure.core.base import (
     ValidationResult,
 )
 from validation_infrastructure.core.types import (
+    TypeDescriptor,
     TypeValidator,
+    compile_type_check,
+    describe_type,
     validate_type,
     is_optional,
     get_type_origin,
@@ -19,7 +22,10 @@ __all__ = [
     "CompositeValidator",
     "ValidationContext",
     "ValidationResult",
+    "TypeDescriptor",
     "TypeValidator",
+    "compile_type_check",
+    "describe_type",
     "validate_type",
     "is_optional",
     "get_type_origin",
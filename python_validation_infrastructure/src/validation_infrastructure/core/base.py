@@ -1,8 +1,18 @@
-"""Base validation classes and core abstractions."""
+"""Base validation classes and core abstractions.
+
+Performance notes:
+    Hot paths are ``CompositeValidator.validate``, ``ValidationContext.child``
+    and ``ValidationResult.merge``/``add_issue``. They are allocation-bound
+    (dataclass instances, dicts, lists), not compute-bound. Optimize them with
+    data layout changes (slotted classes, cheap path structures, shared empty
+    containers, frozensets) and per-shape code generation. Do not attempt
+    vectorization here: there is no numeric inner loop to parallelize.
+"""
 
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -11,8 +21,10 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    ClassVar,
     Dict,
     Generic,
+    Iterable,
     List,
     Optional,
     Set,
@@ -58,7 +70,8 @@ class ValidationIssue:
     severity: ValidationSeverity = ValidationSeverity.ERROR
     path: Optional[str] = None
     value: Any = None
-    context: Dict[str, Any] = field(default_factory=dict)
+    # ``field`` is rebound by the attribute above within this class body
+    context: Dict[str, Any] = dataclasses.field(default_factory=dict)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert issue to dictionary representation."""
@@ -73,9 +86,13 @@ class ValidationIssue:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult(Generic[T]):
-    """Result of a validation operation."""
+    """Result of a validation operation.
+    
+    Slotted: one is allocated per validated value, so instances carry no
+    per-instance ``__dict__``.
+    """
 
     is_valid: bool
     value: Optional[T] = None
@@ -104,15 +121,18 @@ class ValidationResult(Generic[T]):
     @classmethod
     def failure(
         cls,
-        issues: List[ValidationIssue],
+        issues: Iterable[ValidationIssue],
         value: Optional[T] = None,
         metadata: Optional[Dict[str, Any]] = None,
     ) -> ValidationResult[T]:
-        """Create a failed validation result."""
+        """Create a failed validation result.
+        
+        ``issues`` may be any iterable; lists are stored without copying.
+        """
         return cls(
             is_valid=False,
             value=value,
-            issues=issues,
+            issues=issues if type(issues) is list else list(issues),
             metadata=metadata or {},
         )
     
@@ -143,9 +163,12 @@ class ValidationResult(Generic[T]):
     
     def merge(self, other: ValidationResult[Any]) -> ValidationResult[T]:
         """Merge another result into this one."""
-        self.issues.extend(other.issues)
-        self.warnings.extend(other.warnings)
-        self.metadata.update(other.metadata)
+        if other.issues:
+            self.issues.extend(other.issues)
+        if other.warnings:
+            self.warnings.extend(other.warnings)
+        if other.metadata:
+            self.metadata.update(other.metadata)
         if not other.is_valid:
             self.is_valid = False
         return self
@@ -189,6 +212,11 @@ class ValidationContext:
     metadata: Dict[str, Any] = field(default_factory=dict)
     parent: Optional[ValidationContext] = None
     _seen_objects: Set[int] = field(default_factory=set)
+    _cached_path_str: str = field(default="", repr=False)
+    
+    def __post_init__(self) -> None:
+        if self.path and not self._cached_path_str:
+            self._cached_path_str = ".".join(self.path)
     
     def child(
         self,
@@ -198,11 +226,14 @@ class ValidationContext:
         """Create a child context for nested validation."""
         new_path = self.path + [field_name]
         new_depth = self.depth + 1 if increment_depth else self.depth
+        new_cached = (
+            f"{self._cached_path_str}.{field_name}" if self.path else field_name
+        )
         
         if new_depth > self.max_depth:
             raise RecursionError(
                 f"Maximum validation depth ({self.max_depth}) exceeded at path: "
-                f"{'.'.join(new_path)}"
+                f"{new_cached}"
             )
         
         return ValidationContext(
@@ -217,12 +248,13 @@ class ValidationContext:
             metadata=self.metadata.copy(),
             parent=self,
             _seen_objects=self._seen_objects,
+            _cached_path_str=new_cached,
         )
     
     @property
     def current_path(self) -> str:
         """Get current path as dot-separated string."""
-        return ".".join(self.path) if self.path else "<root>"
+        return self._cached_path_str or "<root>"
     
     def has_seen(self, obj: Any) -> bool:
         """Check if object has been seen (for circular reference detection)."""
@@ -244,6 +276,11 @@ class ValidationContext:
 class BaseValidator(ABC, Generic[T]):
     """Abstract base class for all validators."""
 
+    # Whether validate() reads the context (path, field name, settings).
+    # Validators that never do can share their parent's context instead of
+    # receiving a child context per field.
+    uses_context: ClassVar[bool] = True
+
     def __init__(
         self,
         name: Optional[str] = None,
@@ -297,6 +334,7 @@ class BaseValidator(ABC, Generic[T]):
     ) -> BaseValidator[T]:
         """Add a pre-validation hook."""
         self._pre_hooks.append(hook)
+        self._drop_nohooks_validate()
         return self
     
     def add_post_hook(
@@ -305,8 +343,13 @@ class BaseValidator(ABC, Generic[T]):
     ) -> BaseValidator[T]:
         """Add a post-validation hook."""
         self._post_hooks.append(hook)
+        self._drop_nohooks_validate()
         return self
     
+    def _drop_nohooks_validate(self) -> None:
+        """Restore the class validate() if a hook-less variant was bound."""
+        self.__dict__.pop("validate", None)
+    
     def _run_pre_hooks(
         self,
         value: Any,
@@ -481,6 +524,17 @@ class CompositeValidator(BaseValidator[Dict[str, Any]]):
         self.allow_extra = allow_extra
         self.require_all = require_all
     
+    @staticmethod
+    def _field_context(
+        ctx: ValidationContext,
+        field_name: str,
+        validator: BaseValidator[Any],
+    ) -> ValidationContext:
+        """Get the context for a field, reusing ``ctx`` when no child is needed."""
+        if not field_name or not (validator.uses_context or validator._pre_hooks):
+            return ctx
+        return ctx.child(field_name)
+    
     def validate(
         self,
         value: Any,
@@ -516,7 +570,7 @@ class CompositeValidator(BaseValidator[Dict[str, Any]]):
             if field_name not in value:
                 continue
             
-            field_ctx = ctx.child(field_name)
+            field_ctx = self._field_context(ctx, field_name, validator)
             field_result = validator.validate(value[field_name], field_ctx)
             result.merge(field_result)
             
@@ -1,21 +1,44 @@
-"""Type validation and type checking utilities."""
+"""Type validation and type checking utilities.
+
+Performance notes:
+    ``TypeValidator`` compiles its type once into a ``TypeDescriptor`` tree
+    (``describe_type``), with one ``KIND_*`` per node: basic, literal, union,
+    list, dict, tuple and so on. That is the same per-kind dispatch model
+    native validators such as pydantic-core use. Values that already match
+    exactly are accepted by a generated predicate (``compile_type_check``)
+    without allocating contexts or per-node results. Only mismatches and
+    coercions walk the descriptors in ``_validate_desc``. No native
+    (Rust/Cython) kernel ships with this package; one would compile
+    ``describe_type`` output and replace ``compile_type_check`` and the
+    descriptor walk, with the Python path kept as the fallback.
+"""
 
 from __future__ import annotations
 
+import errno
+import functools
+import itertools
+import math
+import os
+import re
+import stat
 import sys
+import time as _time
 from collections.abc import Callable, Mapping, Sequence
-from datetime import date, datetime, time, timedelta
+from datetime import date, datetime, time, timedelta, timezone
 from decimal import Decimal
 from enum import Enum
 from pathlib import Path
 from typing import (
     Any,
+    ClassVar,
     Dict,
     ForwardRef,
     FrozenSet,
     Generic,
     List,
     Literal,
+    NamedTuple,
     Optional,
     Set,
     Tuple,
@@ -24,8 +47,10 @@ from typing import (
     Union,
     get_args,
     get_origin,
+    get_type_hints,
+    is_typeddict,
 )
-from uuid import UUID
+from uuid import UUID, SafeUUID
 
 from validation_infrastructure.core.base import (
     BaseValidator,
@@ -144,15 +169,399 @@ COLLECTION_TYPES: Dict[Any, Tuple[str, int]] = {
 }
 
 
+# Descriptor kinds for TypeValidator dispatch
+KIND_ANY = 0
+KIND_LITERAL = 2
+KIND_UNION = 3
+KIND_LIST = 4
+KIND_DICT = 5
+KIND_TUPLE_FIXED = 6
+KIND_TUPLE_VAR = 7
+KIND_CALLABLE = 8
+KIND_TYPE = 9
+KIND_BASIC = 10
+KIND_TUPLE = 11
+KIND_GENERIC = 12
+
+
+# Kinds whose successful validation returns the value unchanged (without
+# coercion), so the Union arm that matched does not affect the result.
+_IDENTITY_KINDS = frozenset({
+    KIND_ANY,
+    KIND_LITERAL,
+    KIND_CALLABLE,
+    KIND_TYPE,
+    KIND_BASIC,
+    KIND_TUPLE,
+    KIND_GENERIC,
+})
+
+class TypeDescriptor(NamedTuple):
+    """Precomputed dispatch information for one node of a type expression.
+    
+    Attributes:
+        kind: One of the ``KIND_*`` constants.
+        origin: The basic type, or the generic origin for generic kinds.
+        args: Type arguments (Literal values for ``KIND_LITERAL``).
+        children: Descriptors of the item/key/value/arm types.
+        nullable: Whether None is accepted (NoneType or Optional).
+        literal_set: Hashed Literal values, or None if they are unhashable.
+        discriminator: For unions of classes, the name of a Literal-annotated
+            attribute and a map from its values to the matching arm.
+        leaf: Whether validation never reads the context, so items of this
+            type can share their container's context.
+        error_message: Precomputed failure message (unions).
+    """
+
+    kind: int
+    origin: Any
+    args: Tuple[Any, ...]
+    children: Tuple[TypeDescriptor, ...]
+    nullable: bool
+    literal_set: Optional[FrozenSet[Any]] = None
+    discriminator: Optional[Tuple[str, Dict[Any, TypeDescriptor]]] = None
+    leaf: bool = False
+    error_message: Optional[str] = None
+
+
+def _union_discriminator(args: Tuple[Any, ...]) -> Optional[Tuple[str, Dict[Any, int]]]:
+    """Find a Literal-annotated attribute that tells the class arms of a Union apart."""
+    if len(args) < 2:
+        return None
+    
+    arm_hints: List[Dict[str, Any]] = []
+    for arm in args:
+        if not isinstance(arm, type) or is_typeddict(arm):
+            return None
+        try:
+            arm_hints.append(get_type_hints(arm))
+        except Exception:
+            return None
+    
+    for name in arm_hints[0]:
+        mapping: Dict[Any, int] = {}
+        for index, hints in enumerate(arm_hints):
+            hint = hints.get(name)
+            if hint is None or not is_literal_type(hint):
+                break
+            try:
+                if any(v in mapping for v in get_literal_values(hint)):
+                    break
+                mapping.update((v, index) for v in get_literal_values(hint))
+            except TypeError:
+                break
+        else:
+            return name, mapping
+    
+    return None
+
+
+def _describe(tp: Any) -> TypeDescriptor:
+    desc = _describe_node(tp)
+    leaf = desc.kind in _IDENTITY_KINDS or (
+        desc.kind == KIND_UNION and all(child.leaf for child in desc.children)
+    )
+    return desc._replace(leaf=leaf) if leaf != desc.leaf else desc
+
+
+def _describe_node(tp: Any) -> TypeDescriptor:
+    if tp is Any:
+        return TypeDescriptor(KIND_ANY, None, (), (), True)
+    
+    if is_optional(tp):
+        return describe_type(unwrap_optional(tp))._replace(nullable=True)
+    
+    nullable = tp is NoneType
+    
+    if is_literal_type(tp):
+        values = get_literal_values(tp)
+        try:
+            literal_set: Optional[FrozenSet[Any]] = frozenset(values)
+        except TypeError:
+            literal_set = None
+        return TypeDescriptor(KIND_LITERAL, Literal, values, (), nullable, literal_set)
+    
+    origin = get_type_origin(tp)
+    args = get_type_args(tp)
+    
+    if origin is Union or (UnionType is not None and isinstance(tp, UnionType)):
+        children = tuple(describe_type(arg) for arg in args)
+        discriminator = None
+        found = _union_discriminator(args)
+        if found is not None:
+            name, arm_indexes = found
+            discriminator = (name, {v: children[i] for v, i in arm_indexes.items()})
+        type_names = ", ".join(getattr(t, "__name__", str(t)) for t in args)
+        return TypeDescriptor(
+            KIND_UNION, Union, args, children, nullable, None, discriminator,
+            error_message=f"Value does not match any type in Union[{type_names}]",
+        )
+    
+    if origin is None:
+        return TypeDescriptor(KIND_BASIC, tp, (), (), nullable)
+    
+    if origin in (list, set, frozenset) or origin is Sequence:
+        children = (describe_type(args[0]),) if args else ()
+        return TypeDescriptor(KIND_LIST, origin, args, children, nullable)
+    
+    if origin in (dict, Mapping):
+        children = (describe_type(args[0]), describe_type(args[1])) if len(args) >= 2 else ()
+        return TypeDescriptor(KIND_DICT, origin, args, children, nullable)
+    
+    if origin is tuple:
+        if not args:
+            return TypeDescriptor(KIND_TUPLE, origin, args, (), nullable)
+        if len(args) == 2 and args[1] is ...:
+            return TypeDescriptor(
+                KIND_TUPLE_VAR, origin, args, (describe_type(args[0]),), nullable
+            )
+        children = tuple(describe_type(arg) for arg in args)
+        return TypeDescriptor(KIND_TUPLE_FIXED, origin, args, children, nullable)
+    
+    if origin is Callable:
+        return TypeDescriptor(KIND_CALLABLE, origin, args, (), nullable)
+    
+    if origin is type:
+        return TypeDescriptor(KIND_TYPE, origin, args, (), nullable)
+    
+    return TypeDescriptor(KIND_GENERIC, origin, args, (), nullable)
+
+
+def _type_key(tp: Any) -> Any:
+    """Build a cache key for tp that keeps the order of type arguments.
+    
+    ``Union[int, str] == Union[str, int]``, but the order of the arms
+    decides which conversion wins, so a cache keyed on the type alone
+    would hand one of them the other's result.
+    """
+    if isinstance(tp, list):
+        return tuple(_type_key(arg) for arg in tp)
+    args = get_type_args(tp)
+    if not args:
+        return tp
+    return (tp, tuple(_type_key(arg) for arg in args))
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_describe(key: Any, tp: Any) -> TypeDescriptor:
+    return _describe(tp)
+
+
+def describe_type(tp: Any) -> TypeDescriptor:
+    """Get the dispatch descriptor tree for a type expression.
+    
+    Descriptors are cached per type, keeping the order of type arguments;
+    unhashable type expressions are described without caching.
+    """
+    try:
+        return _cached_describe(_type_key(tp), tp)
+    except TypeError:
+        return _describe(tp)
+
+
+def _items_pass_unchanged(items: Any, desc: TypeDescriptor) -> bool:
+    """Check whether every item trivially validates as itself against desc."""
+    if desc.kind == KIND_ANY:
+        return True
+    if desc.kind == KIND_BASIC:
+        item_type = desc.origin
+        return all(type(item) is item_type for item in items)
+    return False
+
+
+# Number of Union matches between re-sorts of the arm order
+UNION_RESORT_INTERVAL = 1024
+
+
+class _UnionProfile:
+    """Hit counts used to try the most frequently matching Union arms first."""
+
+    __slots__ = ("entries", "calls")
+
+    def __init__(self, arms: Tuple[TypeDescriptor, ...]) -> None:
+        # [hit_count, arm] pairs; the list is replaced, never reordered in place
+        self.entries: List[List[Any]] = [[0, arm] for arm in arms]
+        self.calls = 0
+    
+    def record(self, entry: List[Any]) -> None:
+        """Count a match and periodically move frequent arms to the front."""
+        entry[0] += 1
+        self.calls += 1
+        if self.calls % UNION_RESORT_INTERVAL == 0:
+            self.entries = sorted(self.entries, key=lambda e: e[0], reverse=True)
+
+
+# Generic origins whose validation may return a converted container
+_CONVERTING_ORIGINS = (list, set, frozenset, Sequence, dict, Mapping, tuple)
+
+
+class _TypeCheckCodegen:
+    """Generates a flat predicate for a static type expression.
+    
+    The predicate returns True only for values that ``TypeValidator`` accepts
+    without coercion or conversion, so callers can return the value unchanged.
+    False means "take the full validation path", not necessarily invalid.
+    """
+
+    def __init__(self, strict: bool) -> None:
+        self.strict = strict
+        self.namespace: Dict[str, Any] = {}
+        self.lines: List[str] = []
+        self._counter = 0
+    
+    def _name(self, prefix: str) -> str:
+        self._counter += 1
+        return f"{prefix}{self._counter}"
+    
+    def const(self, obj: Any) -> str:
+        """Bind a constant into the generated namespace."""
+        name = self._name("_k")
+        self.namespace[name] = obj
+        return name
+    
+    def func(self, body: List[str]) -> str:
+        """Emit a helper function taking ``v`` and return its name."""
+        name = self._name("_f")
+        self.lines.append(f"def {name}(v):")
+        self.lines.extend(f"    {line}" for line in body)
+        return name
+    
+    def build(self, expected: Any) -> Callable[[Any], bool]:
+        """Compile the predicate for ``expected``."""
+        self.lines.append(f"def _check(v):\n    return {self.expr(expected, 'v')}")
+        exec("\n".join(self.lines), self.namespace)
+        return self.namespace["_check"]  # type: ignore[no-any-return]
+    
+    def expr(self, tp: Any, var: str) -> str:
+        """Return a boolean expression checking ``var`` against ``tp``."""
+        if tp is Any:
+            return "True"
+        
+        if is_optional(tp):
+            return f"({var} is None or {self.expr(unwrap_optional(tp), var)})"
+        
+        if is_literal_type(tp):
+            values = get_literal_values(tp)
+            try:
+                allowed = self.const(frozenset(values))
+            except TypeError:
+                return f"({var} is not None and {var} in {self.const(values)})"
+            name = self.func([
+                "try:",
+                f"    return v is not None and v in {allowed}",
+                "except TypeError:",
+                "    return False",
+            ])
+            return f"{name}({var})"
+        
+        origin = get_type_origin(tp)
+        if origin is Union or (UnionType is not None and isinstance(tp, UnionType)):
+            # An arm that converts containers wins over later exact arms in the
+            # full path, so later arms are left to that path.
+            arms: List[str] = []
+            for arg in get_type_args(tp):
+                arms.append(self.expr(arg, var))
+                if get_type_origin(arg) in _CONVERTING_ORIGINS:
+                    break
+            return f"({var} is not None and ({' or '.join(arms)}))"
+        
+        if origin is not None:
+            return self._generic_expr(tp, origin, var)
+        
+        if not isinstance(tp, type):
+            return "False"
+        if tp is float and not self.strict:
+            return f"isinstance({var}, {self.const((float, int))})"
+        return f"isinstance({var}, {self.const(tp)})"
+    
+    def _generic_expr(self, tp: Any, origin: Any, var: str) -> str:
+        args = get_type_args(tp)
+        
+        if origin in (list, set, frozenset) or origin is Sequence:
+            container = self.const(list if origin is Sequence else origin)
+            body = [f"if type(v) is not {container}:", "    return False"]
+            item = self.expr(args[0], "x") if args else "True"
+            if item != "True":
+                body += ["for x in v:", f"    if not {item}:", "        return False"]
+            return f"{self.func(body + ['return True'])}({var})"
+        
+        if origin in (dict, Mapping):
+            body = ["if type(v) is not dict:", "    return False"]
+            if len(args) >= 2:
+                key = self.expr(args[0], "k")
+                item = self.expr(args[1], "x")
+                if key != "True" or item != "True":
+                    body += [
+                        "for k, x in v.items():",
+                        f"    if not ({key} and {item}):",
+                        "        return False",
+                    ]
+            return f"{self.func(body + ['return True'])}({var})"
+        
+        if origin is tuple:
+            if not args:
+                return f"isinstance({var}, tuple)"
+            body = ["if type(v) is not tuple:", "    return False"]
+            if len(args) == 2 and args[1] is ...:
+                item = self.expr(args[0], "x")
+                if item != "True":
+                    body += ["for x in v:", f"    if not {item}:", "        return False"]
+            else:
+                body += [f"if len(v) != {len(args)}:", "    return False"]
+                for i, item_type in enumerate(args):
+                    item = self.expr(item_type, f"v[{i}]")
+                    if item != "True":
+                        body += [f"if not {item}:", "    return False"]
+            return f"{self.func(body + ['return True'])}({var})"
+        
+        if origin is Callable:
+            return f"callable({var})"
+        
+        if origin is type:
+            if not args:
+                return f"isinstance({var}, type)"
+            if not isinstance(args[0], type):
+                return "False"
+            return f"(isinstance({var}, type) and issubclass({var}, {self.const(args[0])}))"
+        
+        if isinstance(origin, type):
+            return f"isinstance({var}, {self.const(origin)})"
+        return "False"
+
+
+def _build_type_check(expected: Any, strict: bool) -> Callable[[Any], bool]:
+    return _TypeCheckCodegen(strict).build(expected)
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_type_check(key: Any, expected: Any, strict: bool) -> Callable[[Any], bool]:
+    return _build_type_check(expected, strict)
+
+
+def compile_type_check(expected: Any, strict: bool = False) -> Callable[[Any], bool]:
+    """Get a generated predicate for values that match ``expected`` unchanged.
+    
+    Predicates are cached per (type, strict) pair, keeping the order of
+    type arguments; unhashable type expressions are compiled without caching.
+    """
+    try:
+        return _cached_type_check(_type_key(expected), expected, strict)
+    except TypeError:
+        return _build_type_check(expected, strict)
+
+
 class TypeValidator(BaseValidator[T], Generic[T]):
     """Validates that a value matches a specific type."""
 
+    uses_context = False
+
     def __init__(
         self,
         expected_type: Type[T],
         coerce: bool = False,
         strict: bool = False,
         allow_none: bool = False,
+        union_pgo: bool = True,
     ):
         super().__init__(
             name=f"TypeValidator[{getattr(expected_type, '__name__', str(expected_type))}]",
@@ -162,8 +571,40 @@ class TypeValidator(BaseValidator[T], Generic[T]):
         self.coerce = coerce
         self.strict = strict
         self.allow_none = allow_none
+        self._union_pgo = union_pgo
+        self._union_profiles: Dict[int, Optional[_UnionProfile]] = {}
         self._type_origin = get_type_origin(expected_type)
         self._type_args = get_type_args(expected_type)
+        self._desc = describe_type(expected_type)
+        # Coercion may change the value depending on Union arm order, so only
+        # non-coercing validators use the generated fast path.
+        self._fast_check: Optional[Callable[[Any], bool]] = (
+            None if coerce else compile_type_check(expected_type, strict)
+        )
+        # No hooks are registered yet; add_pre_hook/add_post_hook drop this
+        # binding again.
+        if type(self).validate is TypeValidator.validate:
+            self.validate = self._validate_nohooks  # type: ignore[method-assign]
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # The generated predicate cannot be pickled; it, the descriptor and
+        # the union profiles are rebuilt from the type on unpickling
+        state = self.__dict__.copy()
+        for name in ("_desc", "_fast_check", "_union_profiles", "validate"):
+            state.pop(name, None)
+        state["_nohooks"] = "validate" in self.__dict__
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        nohooks = state.pop("_nohooks")
+        self.__dict__.update(state)
+        self._union_profiles = {}
+        self._desc = describe_type(self.expected_type)
+        self._fast_check = (
+            None if self.coerce else compile_type_check(self.expected_type, self.strict)
+        )
+        if nohooks:
+            self.validate = self._validate_nohooks  # type: ignore[method-assign]
     
     def validate(
         self,
@@ -186,10 +627,34 @@ class TypeValidator(BaseValidator[T], Generic[T]):
                 )
             )
         
+        # Values that match exactly need no per-node dispatch
+        if self._fast_check is not None and self._fast_check(value):
+            return self._run_post_hooks(ValidationResult.success(value))
+        
         # Validate the type
-        result = self._validate_type(value, self.expected_type, ctx)
+        result = self._validate_desc(value, self._desc, ctx)
         return self._run_post_hooks(result)
     
+    def _validate_nohooks(
+        self,
+        value: Any,
+        context: Optional[ValidationContext] = None,
+    ) -> ValidationResult[T]:
+        """Same as validate(), used while no hooks are registered."""
+        if value is None:
+            if self.allow_none or is_optional(self.expected_type):
+                return ValidationResult.success(None)  # type: ignore
+            return ValidationResult.from_error(
+                "Value cannot be None",
+                code="null_not_allowed",
+                value=value,
+            )
+        
+        if self._fast_check is not None and self._fast_check(value):
+            return ValidationResult.success(value)
+        
+        return self._validate_desc(value, self._desc, self._create_context(context))
+    
     def _validate_type(
         self,
         value: Any,
@@ -197,14 +662,24 @@ class TypeValidator(BaseValidator[T], Generic[T]):
         ctx: ValidationContext,
     ) -> ValidationResult[T]:
         """Internal type validation with full type support."""
+        return self._validate_desc(value, describe_type(expected), ctx)
+    
+    def _validate_desc(
+        self,
+        value: Any,
+        desc: TypeDescriptor,
+        ctx: ValidationContext,
+    ) -> ValidationResult[T]:
+        """Validate a value against a precomputed type descriptor."""
+        kind = desc.kind
         
         # Handle Any type
-        if expected is Any:
+        if kind == KIND_ANY:
             return ValidationResult.success(value)
         
         # Handle None/Optional
         if value is None:
-            if expected is NoneType or is_optional(expected):
+            if desc.nullable:
                 return ValidationResult.success(None)
             return ValidationResult.from_error(
                 "Value cannot be None",
@@ -212,15 +687,23 @@ class TypeValidator(BaseValidator[T], Generic[T]):
                 value=value,
             )
         
-        # Handle Optional types - unwrap and validate inner type
-        if is_optional(expected):
-            inner_type = unwrap_optional(expected)
-            return self._validate_type(value, inner_type, ctx)
+        # Handle basic types
+        if kind == KIND_BASIC:
+            return self._validate_basic_type(value, desc.origin, ctx)
         
         # Handle Literal types
-        if is_literal_type(expected):
-            allowed = get_literal_values(expected)
-            if value not in allowed:
+        if kind == KIND_LITERAL:
+            allowed = desc.args
+            literal_set = desc.literal_set
+            if literal_set is None:
+                found = value in allowed
+            else:
+                try:
+                    found = value in literal_set
+                except TypeError:
+                    # Unhashable value: compare by equality against the tuple
+                    found = value in allowed
+            if not found:
                 return ValidationResult.from_error(
                     f"Value must be one of {allowed}, got {value!r}",
                     code="literal_error",
@@ -229,26 +712,57 @@ class TypeValidator(BaseValidator[T], Generic[T]):
             return ValidationResult.success(value)
         
         # Handle Union types
-        origin = get_type_origin(expected)
-        if origin is Union or (UnionType is not None and isinstance(expected, UnionType)):
-            args = get_type_args(expected)
-            for arg in args:
-                result = self._validate_type(value, arg, ctx)
-                if result.is_valid:
-                    return result
-            type_names = [getattr(t, "__name__", str(t)) for t in args]
+        if kind == KIND_UNION:
+            # Discriminated union: try the arm named by the discriminator first
+            if desc.discriminator is not None:
+                field_name, arms = desc.discriminator
+                try:
+                    arm = arms.get(getattr(value, field_name, None))
+                except TypeError:
+                    arm = None
+                if arm is not None:
+                    result = self._validate_desc(value, arm, ctx)
+                    if result.is_valid:
+                        return result
+            
+            profile = self._union_profile(desc) if self._union_pgo else None
+            if profile is not None:
+                for entry in profile.entries:
+                    result = self._validate_desc(value, entry[1], ctx)
+                    if result.is_valid:
+                        profile.record(entry)
+                        return result
+            else:
+                for child in desc.children:
+                    result = self._validate_desc(value, child, ctx)
+                    if result.is_valid:
+                        return result
             return ValidationResult.from_error(
-                f"Value does not match any type in Union[{', '.join(type_names)}]",
+                desc.error_message,
                 code="union_error",
                 value=value,
             )
         
         # Handle generic types (List, Dict, etc.)
-        if origin is not None:
-            return self._validate_generic_type(value, expected, origin, ctx)
+        return self._validate_generic_type(value, desc, ctx)
+    
+    def _union_profile(self, desc: TypeDescriptor) -> Optional[_UnionProfile]:
+        """Get the arm-ordering profile for a Union, or None if order matters.
         
-        # Handle basic types
-        return self._validate_basic_type(value, expected, ctx)
+        Arms may only be reordered when whichever arm matches returns the
+        value unchanged, i.e. without coercion and for identity kinds only.
+        """
+        key = id(desc)
+        try:
+            return self._union_profiles[key]
+        except KeyError:
+            pass
+        
+        profile = None
+        if not self.coerce and all(c.kind in _IDENTITY_KINDS for c in desc.children):
+            profile = _UnionProfile(desc.children)
+        self._union_profiles[key] = profile
+        return profile
     
     def _validate_basic_type(
         self,
@@ -258,8 +772,9 @@ class TypeValidator(BaseValidator[T], Generic[T]):
     ) -> ValidationResult[T]:
         """Validate basic (non-generic) types."""
         
-        # Direct type check
-        if isinstance(value, expected):
+        # Direct type check; the exact-type compare is just a cheaper case of
+        # isinstance, so subclasses are still accepted below
+        if type(value) is expected or isinstance(value, expected):
             return ValidationResult.success(value)
         
         # Strict mode - no coercion allowed
@@ -302,15 +817,15 @@ class TypeValidator(BaseValidator[T], Generic[T]):
     def _validate_generic_type(
         self,
         value: Any,
-        expected: Any,
-        origin: Any,
+        desc: TypeDescriptor,
         ctx: ValidationContext,
     ) -> ValidationResult[T]:
         """Validate generic types like List[int], Dict[str, int], etc."""
-        args = get_type_args(expected)
+        kind = desc.kind
+        origin = desc.origin
         
         # List/Set/Sequence validation
-        if origin in (list, set, frozenset) or origin is Sequence:
+        if kind == KIND_LIST:
             expected_container = list if origin is Sequence else origin
             if not isinstance(value, (list, set, frozenset, tuple)):
                 return ValidationResult.from_error(
@@ -319,31 +834,42 @@ class TypeValidator(BaseValidator[T], Generic[T]):
                     value=value,
                 )
             
-            if args:
-                item_type = args[0]
-                validated_items = []
+            if desc.children and not _items_pass_unchanged(value, desc.children[0]):
+                item_desc = desc.children[0]
+                leaf = item_desc.leaf
+                validate_desc = self._validate_desc
+                collect_all = ctx.collect_all_errors
+                # Copied lazily, only once an item comes back changed
+                validated_items: Optional[List[Any]] = None
                 issues: List[ValidationIssue] = []
                 
                 for i, item in enumerate(value):
-                    item_ctx = ctx.child(str(i))
-                    item_result = self._validate_type(item, item_type, item_ctx)
+                    item_ctx = ctx if leaf else ctx.child(str(i))
+                    item_result = validate_desc(item, item_desc, item_ctx)
                     if item_result.is_valid:
-                        validated_items.append(item_result.value)
+                        item_value = item_result.value
+                        if validated_items is not None:
+                            validated_items.append(item_value)
+                        elif item_value is not item:
+                            validated_items = list(itertools.islice(value, i))
+                            validated_items.append(item_value)
                     else:
                         issues.extend(item_result.issues)
-                        if not ctx.collect_all_errors:
+                        if not collect_all:
                             break
-                        validated_items.append(item)
                 
                 if issues:
                     return ValidationResult.failure(issues, value=value)
                 
-                return ValidationResult.success(expected_container(validated_items))
+                if validated_items is not None:
+                    return ValidationResult.success(expected_container(validated_items))
             
+            if type(value) is expected_container:
+                return ValidationResult.success(value)
             return ValidationResult.success(expected_container(value))
         
         # Dict/Mapping validation
-        if origin in (dict, Mapping):
+        if kind == KIND_DICT:
             if not isinstance(value, dict):
                 return ValidationResult.from_error(
                     f"Expected dict, got {type(value).__name__}",
@@ -351,35 +877,47 @@ class TypeValidator(BaseValidator[T], Generic[T]):
                     value=value,
                 )
             
-            if len(args) >= 2:
-                key_type, value_type = args[0], args[1]
-                validated_dict: Dict[Any, Any] = {}
+            if desc.children:
+                key_desc, value_desc = desc.children
+                key_leaf = key_desc.leaf
+                value_leaf = value_desc.leaf
+                validate_desc = self._validate_desc
+                collect_all = ctx.collect_all_errors
+                validated_dict: Optional[Dict[Any, Any]] = None
                 issues = []
                 
-                for k, v in value.items():
-                    key_ctx = ctx.child(f"key({k})")
-                    key_result = self._validate_type(k, key_type, key_ctx)
+                for i, (k, v) in enumerate(value.items()):
+                    key_ctx = ctx if key_leaf else ctx.child(f"key({k})")
+                    key_result = validate_desc(k, key_desc, key_ctx)
                     
-                    value_ctx = ctx.child(str(k))
-                    value_result = self._validate_type(v, value_type, value_ctx)
+                    value_ctx = ctx if value_leaf else ctx.child(str(k))
+                    value_result = validate_desc(v, value_desc, value_ctx)
                     
                     if key_result.is_valid and value_result.is_valid:
-                        validated_dict[key_result.value] = value_result.value
+                        new_key, new_value = key_result.value, value_result.value
+                        if validated_dict is not None:
+                            validated_dict[new_key] = new_value
+                        elif new_key is not k or new_value is not v:
+                            validated_dict = dict(itertools.islice(value.items(), i))
+                            validated_dict[new_key] = new_value
                     else:
                         issues.extend(key_result.issues)
                         issues.extend(value_result.issues)
-                        if not ctx.collect_all_errors:
+                        if not collect_all:
                             break
                 
                 if issues:
                     return ValidationResult.failure(issues, value=value)
                 
-                return ValidationResult.success(validated_dict)
+                if validated_dict is not None:
+                    return ValidationResult.success(validated_dict)
             
+            if type(value) is dict:
+                return ValidationResult.success(value)
             return ValidationResult.success(dict(value))
         
         # Tuple validation
-        if origin is tuple:
+        if kind in (KIND_TUPLE, KIND_TUPLE_VAR, KIND_TUPLE_FIXED):
             if not isinstance(value, tuple):
                 if self.coerce and isinstance(value, (list, set)):
                     value = tuple(value)
@@ -390,54 +928,73 @@ class TypeValidator(BaseValidator[T], Generic[T]):
                         value=value,
                     )
             
-            if args:
-                # Check for variadic tuple (Tuple[int, ...])
-                if len(args) == 2 and args[1] is ...:
-                    item_type = args[0]
-                    validated_items = []
-                    issues = []
-                    
-                    for i, item in enumerate(value):
-                        item_ctx = ctx.child(str(i))
-                        item_result = self._validate_type(item, item_type, item_ctx)
-                        if item_result.is_valid:
-                            validated_items.append(item_result.value)
-                        else:
-                            issues.extend(item_result.issues)
-                            validated_items.append(item)
-                    
-                    if issues:
-                        return ValidationResult.failure(issues, value=value)
-                    return ValidationResult.success(tuple(validated_items))
-                
-                # Fixed-length tuple
-                if len(value) != len(args):
-                    return ValidationResult.from_error(
-                        f"Expected tuple of length {len(args)}, got length {len(value)}",
-                        code="tuple_length_error",
-                        value=value,
-                    )
-                
-                validated_items = []
+            if kind == KIND_TUPLE:
+                return ValidationResult.success(value)
+            
+            # Variadic tuple (Tuple[int, ...])
+            if kind == KIND_TUPLE_VAR:
+                item_desc = desc.children[0]
+                leaf = item_desc.leaf
+                validate_desc = self._validate_desc
+                validated_items = None
                 issues = []
                 
-                for i, (item, item_type) in enumerate(zip(value, args)):
-                    item_ctx = ctx.child(str(i))
-                    item_result = self._validate_type(item, item_type, item_ctx)
+                for i, item in enumerate(value):
+                    item_ctx = ctx if leaf else ctx.child(str(i))
+                    item_result = validate_desc(item, item_desc, item_ctx)
                     if item_result.is_valid:
-                        validated_items.append(item_result.value)
+                        item_value = item_result.value
+                        if validated_items is not None:
+                            validated_items.append(item_value)
+                        elif item_value is not item:
+                            validated_items = list(value[:i])
+                            validated_items.append(item_value)
                     else:
                         issues.extend(item_result.issues)
-                        validated_items.append(item)
                 
                 if issues:
                     return ValidationResult.failure(issues, value=value)
-                return ValidationResult.success(tuple(validated_items))
+                if validated_items is None and type(value) is tuple:
+                    return ValidationResult.success(value)
+                return ValidationResult.success(
+                    tuple(value if validated_items is None else validated_items)
+                )
             
-            return ValidationResult.success(value)
+            # Fixed-length tuple
+            if len(value) != len(desc.children):
+                return ValidationResult.from_error(
+                    f"Expected tuple of length {len(desc.children)}, got length {len(value)}",
+                    code="tuple_length_error",
+                    value=value,
+                )
+            
+            validate_desc = self._validate_desc
+            validated_items = None
+            issues = []
+            
+            for i, (item, item_desc) in enumerate(zip(value, desc.children, strict=True)):
+                item_ctx = ctx if item_desc.leaf else ctx.child(str(i))
+                item_result = validate_desc(item, item_desc, item_ctx)
+                if item_result.is_valid:
+                    item_value = item_result.value
+                    if validated_items is not None:
+                        validated_items.append(item_value)
+                    elif item_value is not item:
+                        validated_items = list(value[:i])
+                        validated_items.append(item_value)
+                else:
+                    issues.extend(item_result.issues)
+            
+            if issues:
+                return ValidationResult.failure(issues, value=value)
+            if validated_items is None and type(value) is tuple:
+                return ValidationResult.success(value)
+            return ValidationResult.success(
+                tuple(value if validated_items is None else validated_items)
+            )
         
         # Callable validation (basic check)
-        if origin is Callable:
+        if kind == KIND_CALLABLE:
             if not callable(value):
                 return ValidationResult.from_error(
                     f"Expected callable, got {type(value).__name__}",
@@ -447,7 +1004,8 @@ class TypeValidator(BaseValidator[T], Generic[T]):
             return ValidationResult.success(value)
         
         # Type[X] validation
-        if origin is type:
+        if kind == KIND_TYPE:
+            args = desc.args
             if not isinstance(value, type):
                 return ValidationResult.from_error(
                     f"Expected type, got {type(value).__name__}",
@@ -491,8 +1049,61 @@ def validate_type(
     return validator.validate(value, context)
 
 
-class StringValidator(BaseValidator[str]):
-    """Validates string values with various constraints."""
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a regex once and share it across validators."""
+    return re.compile(pattern)
+
+
+class _GeneratedRunMixin:
+    """Keeps a validator's exec-generated ``_run`` in step with its settings.
+    
+    Assigning an attribute named in ``_compiled_attrs`` rebuilds ``_run``.
+    Generated functions cannot be pickled, so pickles leave ``_run`` out and
+    unpickling rebuilds it.
+    """
+    
+    _compiled_attrs: ClassVar[FrozenSet[str]] = frozenset()
+    
+    def _compile(self) -> Callable[..., Any]:
+        raise NotImplementedError
+    
+    def _rebuild(self) -> None:
+        """Regenerate ``_run`` (and anything it derives from the settings)."""
+        self._run = self._compile()
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # __init__ builds _run once all settings are in place
+        if name in self._compiled_attrs and "_run" in self.__dict__:
+            self._rebuild()
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state.pop("_run", None)
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._rebuild()
+
+
+class StringValidator(_GeneratedRunMixin, BaseValidator[str]):
+    """Validates string values with various constraints.
+    
+    The enabled transforms and checks are compiled into a single function,
+    which is regenerated whenever a constraint attribute is assigned.
+    """
+    
+    _compiled_attrs = frozenset({
+        "min_length",
+        "max_length",
+        "pattern",
+        "strip_whitespace",
+        "to_lower",
+        "to_upper",
+        "allow_empty",
+    })
 
     def __init__(
         self,
@@ -512,37 +1123,83 @@ class StringValidator(BaseValidator[str]):
         self.to_lower = to_lower
         self.to_upper = to_upper
         self.allow_empty = allow_empty
+        self._rebuild()
+    
+    def _rebuild(self) -> None:
+        self._compiled_pattern = _compile_pattern(self.pattern) if self.pattern else None
+        
+        # Transforms run in this order, chained into one expression
+        self._transform_ops: Tuple[str, ...] = tuple(
+            name
+            for name, enabled in (
+                ("strip", self.strip_whitespace),
+                ("lower", self.to_lower),
+                ("upper", self.to_upper),
+            )
+            if enabled
+        )
+        super()._rebuild()
+    
+    def _compile(self) -> Callable[[Any, Optional[ValidationContext]], ValidationResult[str]]:
+        """Generate a validate function containing only the enabled steps."""
+        namespace: Dict[str, Any] = {
+            "_success": ValidationResult.success,
+            "_type_error": self._type_error,
+            "_fail": self._fail,
+            "_min": self.min_length,
+            "_max": self.max_length,
+        }
+        lines = [
+            "def _run(value, context):",
+            "    if not isinstance(value, str):",
+            "        return _type_error(value)",
+            "    v = value",
+        ]
         
-        if pattern:
-            import re
-            self._compiled_pattern = re.compile(pattern)
-        else:
-            self._compiled_pattern = None
+        # Apply transformations
+        if self._transform_ops:
+            lines.append("    v = v" + "".join(f".{op}()" for op in self._transform_ops))
+        
+        # Any failing check sends the value to _fail, which reports every issue
+        checks: List[str] = []
+        if not self.allow_empty:
+            checks.append("not v")
+        if self.min_length is not None:
+            checks.append("len(v) < _min")
+        if self.max_length is not None:
+            checks.append("len(v) > _max")
+        if self._compiled_pattern:
+            namespace["_match"] = self._compiled_pattern.match
+            checks.append("not _match(v)")
+        if checks:
+            lines.append(f"    if {' or '.join(checks)}:")
+            lines.append("        return _fail(v, context)")
+        
+        lines.append("    return _success(v)")
+        exec("\n".join(lines), namespace)
+        return namespace["_run"]  # type: ignore[no-any-return]
     
     def validate(
         self,
         value: Any,
         context: Optional[ValidationContext] = None,
     ) -> ValidationResult[str]:
+        return self._run(value, context)
+    
+    def _type_error(self, value: Any) -> ValidationResult[str]:
+        return ValidationResult.from_error(
+            f"Expected string, got {type(value).__name__}",
+            code="type_error",
+            value=value,
+        )
+    
+    def _fail(
+        self,
+        result_value: str,
+        context: Optional[ValidationContext],
+    ) -> ValidationResult[str]:
+        """Build the failure result for a transformed value that failed a check."""
         ctx = self._create_context(context)
-        
-        if not isinstance(value, str):
-            return ValidationResult.from_error(
-                f"Expected string, got {type(value).__name__}",
-                code="type_error",
-                value=value,
-            )
-        
-        result_value = value
-        
-        # Apply transformations
-        if self.strip_whitespace:
-            result_value = result_value.strip()
-        if self.to_lower:
-            result_value = result_value.lower()
-        if self.to_upper:
-            result_value = result_value.upper()
-        
         issues: List[ValidationIssue] = []
         
         # Empty check
@@ -588,14 +1245,46 @@ class StringValidator(BaseValidator[str]):
                 )
             )
         
-        if issues:
-            return ValidationResult.failure(issues, value=result_value)
-        
-        return ValidationResult.success(result_value)
+        return ValidationResult.failure(issues, value=result_value)
+
 
+# Tolerance for float multiple_of checks, as a fraction of multiple_of
+MULTIPLE_OF_RTOL = 1e-9
 
-class NumericValidator(BaseValidator[T], Generic[T]):
-    """Validates numeric values with constraints."""
+
+def _is_multiple_of(value: Any, multiple_of: Any) -> bool:
+    """Check value against multiple_of, allowing float rounding error.
+    
+    Integers and Decimals use exact modulo; anything involving a float uses
+    the IEEE remainder, so e.g. 0.3 counts as a multiple of 0.1.
+    """
+    if (isinstance(value, float) or isinstance(multiple_of, float)) and not (
+        isinstance(value, Decimal) or isinstance(multiple_of, Decimal)
+    ):
+        if not math.isfinite(value):
+            return False
+        remainder = math.remainder(value, multiple_of)
+        return abs(remainder) <= MULTIPLE_OF_RTOL * abs(multiple_of)
+    return value % multiple_of == 0
+
+
+class NumericValidator(_GeneratedRunMixin, BaseValidator[T], Generic[T]):
+    """Validates numeric values with constraints.
+    
+    The enabled checks are compiled into a single function, which is
+    regenerated whenever a constraint attribute is assigned.
+    """
+    
+    _compiled_attrs = frozenset({
+        "numeric_type",
+        "minimum",
+        "maximum",
+        "exclusive_minimum",
+        "exclusive_maximum",
+        "multiple_of",
+        "allow_nan",
+        "allow_infinity",
+    })
 
     def __init__(
         self,
@@ -620,36 +1309,108 @@ class NumericValidator(BaseValidator[T], Generic[T]):
         self.multiple_of = multiple_of
         self.allow_nan = allow_nan
         self.allow_infinity = allow_infinity
+        self._rebuild()
+    
+    def _compile(self) -> Callable[[Any, Optional[ValidationContext]], ValidationResult[T]]:
+        """Generate a validate function containing only the enabled checks."""
+        namespace: Dict[str, Any] = {
+            "_Decimal": Decimal,
+            "_convert": self.numeric_type,
+            "_success": ValidationResult.success,
+            "_type_error": self._type_error,
+            "_conversion_error": self._conversion_error,
+            "_fail": self._fail,
+            "_isinf": math.isinf,
+            "_isfinite": math.isfinite,
+            "_min": self.minimum,
+            "_max": self.maximum,
+            "_xmin": self.exclusive_minimum,
+            "_xmax": self.exclusive_maximum,
+            "_mult": self.multiple_of,
+            "_is_multiple_of": _is_multiple_of,
+        }
+        lines = [
+            # Bind constants as keyword-only defaults so they are fast locals
+            f"def _run(value, context, *, {', '.join(f'{n}={n}' for n in namespace)}):",
+            "    t = type(value)",
+            "    if (",
+            "        t is not int and t is not float",
+            "        and not isinstance(value, (int, float, _Decimal))",
+            "    ):",
+            "        return _type_error(value)",
+            "    try:",
+            "        v = _convert(value)",
+            "    except (ValueError, TypeError) as e:",
+            "        return _conversion_error(value, e)",
+        ]
+        
+        # Any failing check sends the value to _fail, which reports every issue
+        checks: List[str] = []
+        if not self.allow_nan and not self.allow_infinity:
+            float_check = "not _isfinite(v)"
+        elif not self.allow_nan:
+            float_check = "v != v"
+        elif not self.allow_infinity:
+            float_check = "_isinf(v)"
+        else:
+            float_check = None
+        if float_check is not None:
+            if self.numeric_type is not float:
+                float_check = f"(isinstance(v, float) and {float_check})"
+            checks.append(float_check)
+        if self.minimum is not None:
+            checks.append("v < _min")
+        if self.maximum is not None:
+            checks.append("v > _max")
+        if self.exclusive_minimum is not None:
+            checks.append("v <= _xmin")
+        if self.exclusive_maximum is not None:
+            checks.append("v >= _xmax")
+        if self.multiple_of is not None:
+            if self.numeric_type is int and type(self.multiple_of) is int:
+                checks.append("v % _mult != 0")
+            else:
+                checks.append("not _is_multiple_of(v, _mult)")
+        if checks:
+            lines.append(f"    if {' or '.join(checks)}:")
+            lines.append("        return _fail(v, context)")
+        
+        lines.append("    return _success(v)")
+        exec("\n".join(lines), namespace)
+        return namespace["_run"]  # type: ignore[no-any-return]
     
     def validate(
         self,
         value: Any,
         context: Optional[ValidationContext] = None,
     ) -> ValidationResult[T]:
+        return self._run(value, context)
+    
+    def _type_error(self, value: Any) -> ValidationResult[T]:
+        return ValidationResult.from_error(
+            f"Expected numeric type, got {type(value).__name__}",
+            code="type_error",
+            value=value,
+        )
+    
+    def _conversion_error(self, value: Any, error: Exception) -> ValidationResult[T]:
+        return ValidationResult.from_error(
+            f"Cannot convert to {self.numeric_type.__name__}: {error}",
+            code="conversion_error",
+            value=value,
+        )
+    
+    def _fail(
+        self,
+        numeric_value: Any,
+        context: Optional[ValidationContext],
+    ) -> ValidationResult[T]:
+        """Build the failure result for a converted value that failed a check."""
         ctx = self._create_context(context)
-        
-        if not isinstance(value, (int, float, Decimal)):
-            return ValidationResult.from_error(
-                f"Expected numeric type, got {type(value).__name__}",
-                code="type_error",
-                value=value,
-            )
-        
-        # Convert to target type
-        try:
-            numeric_value = self.numeric_type(value)
-        except (ValueError, TypeError) as e:
-            return ValidationResult.from_error(
-                f"Cannot convert to {self.numeric_type.__name__}: {e}",
-                code="conversion_error",
-                value=value,
-            )
-        
         issues: List[ValidationIssue] = []
         
         # Check for NaN
         if isinstance(numeric_value, float):
-            import math
             if math.isnan(numeric_value) and not self.allow_nan:
                 issues.append(
                     self._create_issue(
@@ -713,7 +1474,7 @@ class NumericValidator(BaseValidator[T], Generic[T]):
         
         # Multiple of check
         if self.multiple_of is not None:
-            if numeric_value % self.multiple_of != 0:
+            if not _is_multiple_of(numeric_value, self.multiple_of):
                 issues.append(
                     self._create_issue(
                         f"Value {numeric_value} is not a multiple of {self.multiple_of}",
@@ -723,15 +1484,14 @@ class NumericValidator(BaseValidator[T], Generic[T]):
                     )
                 )
         
-        if issues:
-            return ValidationResult.failure(issues, value=numeric_value)
-        
-        return ValidationResult.success(numeric_value)
+        return ValidationResult.failure(issues, value=numeric_value)
 
 
 class EnumValidator(BaseValidator[T], Generic[T]):
     """Validates enum values."""
 
+    uses_context = False
+
     def __init__(
         self,
         enum_class: Type[T],
@@ -745,6 +1505,34 @@ class EnumValidator(BaseValidator[T], Generic[T]):
         self.enum_class = enum_class
         self.allow_value = allow_value
         self.allow_name = allow_name
+        # Value -> first member with that value; members whose value is
+        # unhashable are kept aside and compared one by one.
+        self._by_value: Dict[Any, Any] = {}
+        self._unhashable_members: List[Any] = []
+        for member in enum_class:  # type: ignore
+            try:
+                self._by_value.setdefault(member.value, member)
+            except TypeError:
+                self._unhashable_members.append(member)
+        self._valid_values_text = ", ".join(
+            f"{m.name}={m.value!r}" for m in enum_class  # type: ignore
+        )
+    
+    def _find_by_value(self, value: Any) -> Optional[T]:
+        """Return the first member whose value equals value, if any."""
+        try:
+            member = self._by_value.get(value)
+        except TypeError:
+            # Unhashable value: fall back to comparing against every member
+            candidates = self.enum_class
+        else:
+            if member is not None or not self._unhashable_members:
+                return member
+            candidates = self._unhashable_members
+        for candidate in candidates:  # type: ignore
+            if candidate.value == value:
+                return candidate
+        return None
     
     def validate(
         self,
@@ -759,9 +1547,9 @@ class EnumValidator(BaseValidator[T], Generic[T]):
         
         # Try by value
         if self.allow_value:
-            for member in self.enum_class:  # type: ignore
-                if member.value == value:
-                    return ValidationResult.success(member)
+            member = self._find_by_value(value)
+            if member is not None:
+                return ValidationResult.success(member)
         
         # Try by name
         if self.allow_name and isinstance(value, str):
@@ -770,14 +1558,75 @@ class EnumValidator(BaseValidator[T], Generic[T]):
             except KeyError:
                 pass
         
-        valid_values = [f"{m.name}={m.value!r}" for m in self.enum_class]  # type: ignore
         return ValidationResult.from_error(
-            f"Invalid enum value: {value!r}. Valid values: {', '.join(valid_values)}",
+            f"Invalid enum value: {value!r}. Valid values: {self._valid_values_text}",
             code="invalid_enum",
             value=value,
         )
 
 
+# Numeric strptime directives, with the same sub-patterns _strptime uses
+_STRPTIME_FIELDS: Dict[str, str] = {
+    "Y": r"\d\d\d\d",
+    "m": r"1[0-2]|0[1-9]|[1-9]",
+    "d": r"3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9]",
+    "H": r"2[0-3]|[0-1]\d|\d",
+    "M": r"[0-5]\d|\d",
+    "S": r"6[0-1]|[0-5]\d|\d",
+    "f": r"[0-9]{1,6}",
+}
+
+
+def _strptime_regex(fmt: str, index: int) -> Optional[str]:
+    """Translate a strptime format into an equivalent regex alternative.
+    
+    Returns None for formats using directives other than the numeric
+    date/time ones; those are left to ``datetime.strptime``.
+    """
+    parts: List[str] = []
+    seen: Set[str] = set()
+    pos = 0
+    for match in re.finditer(r"%(.)|\s+", fmt):
+        literal = fmt[pos:match.start()]
+        if "%" in literal:
+            return None
+        parts.append(re.escape(literal))
+        pos = match.end()
+        directive = match.group(1)
+        if directive is None:
+            parts.append(r"\s+")
+        elif directive == "%":
+            parts.append("%")
+        elif directive in _STRPTIME_FIELDS and directive not in seen:
+            seen.add(directive)
+            parts.append(f"(?P<{directive}{index}>{_STRPTIME_FIELDS[directive]})")
+        else:
+            return None
+    if "%" in fmt[pos:]:
+        return None
+    parts.append(re.escape(fmt[pos:]))
+    return f"(?P<_{index}>{''.join(parts)})"
+
+
+def _compile_datetime_formats(
+    formats: List[str],
+) -> Tuple[Optional[re.Pattern[str]], int]:
+    """Combine the leading translatable formats into one alternation.
+    
+    Returns the pattern (None if no format translates) and the number of
+    formats it covers.
+    """
+    alternatives = []
+    for index, fmt in enumerate(formats):
+        alternative = _strptime_regex(fmt, index)
+        if alternative is None:
+            break
+        alternatives.append(alternative)
+    if not alternatives:
+        return None, 0
+    return re.compile("|".join(alternatives), re.IGNORECASE), len(alternatives)
+
+
 class DateTimeValidator(BaseValidator[datetime]):
     """Validates datetime values."""
 
@@ -800,6 +1649,40 @@ class DateTimeValidator(BaseValidator[datetime]):
             "%Y-%m-%d %H:%M:%S",
             "%Y-%m-%d",
         ]
+        # The first _regex_formats formats are matched by one combined regex
+        self._formats_re, self._regex_formats = _compile_datetime_formats(self.formats)
+    
+    def _parse(self, value: str) -> Optional[datetime]:
+        """Parse a string using the configured formats, in order."""
+        start = 0
+        if self._formats_re is not None:
+            match = self._formats_re.fullmatch(value)
+            if match is not None:
+                index = match.lastgroup[1:]  # type: ignore[index]
+                fields = match.groupdict()
+                microsecond = fields.get(f"f{index}")
+                try:
+                    return datetime(
+                        int(fields.get(f"Y{index}") or 1900),
+                        int(fields.get(f"m{index}") or 1),
+                        int(fields.get(f"d{index}") or 1),
+                        int(fields.get(f"H{index}") or 0),
+                        int(fields.get(f"M{index}") or 0),
+                        int(fields.get(f"S{index}") or 0),
+                        int(microsecond.ljust(6, "0")) if microsecond else 0,
+                    )
+                except ValueError:
+                    # Out-of-range field: let strptime decide from the top
+                    pass
+            else:
+                start = self._regex_formats
+        
+        for fmt in self.formats[start:]:
+            try:
+                return datetime.strptime(value, fmt)
+            except ValueError:
+                continue
+        return None
     
     def validate(
         self,
@@ -815,14 +1698,7 @@ class DateTimeValidator(BaseValidator[datetime]):
         elif isinstance(value, date):
             dt_value = datetime.combine(value, time())
         elif isinstance(value, str):
-            dt_value = None  # type: ignore
-            for fmt in self.formats:
-                try:
-                    dt_value = datetime.strptime(value, fmt)
-                    break
-                except ValueError:
-                    continue
-            
+            dt_value = self._parse(value)  # type: ignore[assignment]
             if dt_value is None:
                 return ValidationResult.from_error(
                     f"Cannot parse datetime from string: {value!r}",
@@ -837,7 +1713,9 @@ class DateTimeValidator(BaseValidator[datetime]):
             )
         
         issues: List[ValidationIssue] = []
-        now = datetime.utcnow()
+        if not (self.allow_past and self.allow_future):
+            # Naive UTC, as datetime.utcnow() returned (deprecated in 3.12)
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
         
         if not self.allow_past and dt_value < now:
             issues.append(
@@ -885,64 +1763,182 @@ class DateTimeValidator(BaseValidator[datetime]):
         return ValidationResult.success(dt_value)
 
 
+# UUID is immutable through __setattr__; its slot descriptors set the
+# fields directly, as UUID.__init__ itself does via object.__setattr__.
+_set_uuid_int = UUID.__dict__["int"].__set__
+_set_uuid_is_safe = UUID.__dict__["is_safe"].__set__
+
+
+def _uuid_from_int(number: int) -> UUID:
+    """Build a UUID from its 128-bit integer without re-checking it."""
+    uuid_value = object.__new__(UUID)
+    _set_uuid_int(uuid_value, number)
+    _set_uuid_is_safe(uuid_value, SafeUUID.unknown)
+    return uuid_value
+
+
+def _parse_uuid(value: str) -> UUID:
+    """Parse a UUID string; same results and errors as ``UUID(value)``.
+    
+    The canonical 8-4-4-4-12 layout is decoded directly. Anything else
+    (braces, ``urn:uuid:`` prefixes, stray characters) goes through the
+    stdlib constructor. The per-character work already happens in C
+    (``str.replace`` and ``int(..., 16)``); what remains in Python is a
+    fixed handful of operations, so a compiled parser would only shave
+    call overhead.
+    """
+    if (
+        len(value) == 36
+        and value[8] == "-"
+        and value[13] == "-"
+        and value[18] == "-"
+        and value[23] == "-"
+    ):
+        try:
+            return _uuid_from_int(int(value.replace("-", ""), 16))
+        except ValueError:
+            pass
+    return UUID(value)
+
+
+def _uuid_bytes_version(value: bytes) -> Optional[int]:
+    """UUID.version for 16 big-endian bytes, without building the UUID."""
+    # Only RFC 4122 variant UUIDs have a version
+    if value[8] & 0xC0 != 0x80:
+        return None
+    return value[6] >> 4
+
+
 class UUIDValidator(BaseValidator[UUID]):
-    """Validates UUID values."""
+    """Validates UUID values.
+    
+    With ``lazy=True``, valid 16-byte ``bytes`` inputs are checked in place
+    and returned as-is instead of being converted to ``UUID``.
+    """
+
+    uses_context = False
 
     def __init__(
         self,
         versions: Optional[List[int]] = None,
+        lazy: bool = False,
     ):
         super().__init__(name="UUIDValidator", error_code="uuid_error")
         self.versions = versions
+        self.lazy = lazy
+        # Version predicate for the configured set; a bound method pickles
+        self._version_ok: Optional[Callable[[Optional[int]], bool]] = (
+            frozenset(versions).__contains__ if versions else None
+        )
     
     def validate(
         self,
         value: Any,
         context: Optional[ValidationContext] = None,
     ) -> ValidationResult[UUID]:
-        ctx = self._create_context(context)
-        
-        uuid_value: UUID
-        
-        if isinstance(value, UUID):
-            uuid_value = value
-        elif isinstance(value, str):
-            try:
-                uuid_value = UUID(value)
-            except ValueError:
-                return ValidationResult.from_error(
-                    f"Invalid UUID string: {value!r}",
-                    code="invalid_uuid",
-                    value=value,
-                )
-        elif isinstance(value, bytes):
-            try:
-                uuid_value = UUID(bytes=value)
-            except ValueError:
+        handler = _UUID_HANDLERS.get(type(value))
+        if handler is None:
+            # Subclasses miss the exact-type lookup
+            for base, base_handler in _UUID_HANDLERS.items():
+                if isinstance(value, base):
+                    handler = base_handler
+                    break
+            else:
                 return ValidationResult.from_error(
-                    f"Invalid UUID bytes",
-                    code="invalid_uuid",
+                    f"Expected UUID, got {type(value).__name__}",
+                    code="type_error",
                     value=value,
                 )
-        else:
+        
+        # Looked up on self so subclasses can override the handlers
+        return getattr(self, handler)(value)
+    
+    def _from_uuid(self, value: UUID) -> ValidationResult[UUID]:
+        if self._version_ok is None:
+            return ValidationResult.success(value)
+        return self._check_version(value.version, value)
+    
+    def _from_str(self, value: str) -> ValidationResult[UUID]:
+        try:
+            uuid_value = _parse_uuid(value)
+        except ValueError:
             return ValidationResult.from_error(
-                f"Expected UUID, got {type(value).__name__}",
-                code="type_error",
+                f"Invalid UUID string: {value!r}",
+                code="invalid_uuid",
                 value=value,
             )
-        
-        if self.versions and uuid_value.version not in self.versions:
+        return self._from_uuid(uuid_value)
+    
+    def _from_bytes(self, value: bytes) -> ValidationResult[UUID]:
+        if len(value) != 16:
             return ValidationResult.from_error(
-                f"UUID version {uuid_value.version} not in allowed versions {self.versions}",
+                f"Invalid UUID bytes",
+                code="invalid_uuid",
+                value=value,
+            )
+        if self.lazy:
+            return self._check_version(_uuid_bytes_version(value), value)
+        return self._from_uuid(_uuid_from_int(int.from_bytes(value, "big")))
+    
+    def _check_version(self, version: Optional[int], value: Any) -> ValidationResult[UUID]:
+        if self._version_ok is not None and not self._version_ok(version):
+            return ValidationResult.from_error(
+                f"UUID version {version} not in allowed versions {self.versions}",
                 code="invalid_uuid_version",
-                value=uuid_value,
+                value=value,
             )
         
-        return ValidationResult.success(uuid_value)
+        return ValidationResult.success(value)
+
+
+# Exact input type -> UUIDValidator handler name, in isinstance-fallback order
+_UUID_HANDLERS: Dict[type, str] = {
+    UUID: "_from_uuid",
+    str: "_from_str",
+    bytes: "_from_bytes",
+}
+
+
+# stat() errors that pathlib's exists()/is_file()/is_dir() treat as "no"
+_STAT_MISSING_ERRNOS = frozenset({errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP})
+_STAT_MISSING_WINERRORS = frozenset({21, 123, 1921})
+
+
+def _stat_mode(path: Path) -> Optional[int]:
+    """Return the st_mode of path, or None where pathlib would report a miss."""
+    try:
+        return os.stat(path).st_mode
+    except OSError as e:
+        if (
+            e.errno not in _STAT_MISSING_ERRNOS
+            and getattr(e, "winerror", None) not in _STAT_MISSING_WINERRORS
+        ):
+            raise
+        return None
+    except ValueError:
+        # Embedded NUL or otherwise unrepresentable path
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_stat_mode(path_str: str, ttl: float, epoch: int) -> Optional[int]:
+    """_stat_mode memoised per TTL window; epoch changes every ttl seconds."""
+    return _stat_mode(Path(path_str))
+
+
+# Exact input type -> Path coercion for PathValidator
+_PATH_COERCIONS: Dict[type, Callable[[Any], Path]] = {
+    type(Path()): lambda value: value,
+    str: Path,
+}
 
 
 class PathValidator(BaseValidator[Path]):
-    """Validates file system paths."""
+    """Validates file system paths.
+    
+    With ``stat_cache_ttl`` set, stat results for absolute paths are shared
+    process-wide and may be up to that many seconds old.
+    """
 
     def __init__(
         self,
@@ -951,6 +1947,7 @@ class PathValidator(BaseValidator[Path]):
         must_be_dir: bool = False,
         must_be_absolute: bool = False,
         allowed_extensions: Optional[List[str]] = None,
+        stat_cache_ttl: Optional[float] = None,
     ):
         super().__init__(name="PathValidator", error_code="path_error")
         self.must_exist = must_exist
@@ -958,15 +1955,20 @@ class PathValidator(BaseValidator[Path]):
         self.must_be_dir = must_be_dir
         self.must_be_absolute = must_be_absolute
         self.allowed_extensions = allowed_extensions
+        self.stat_cache_ttl = stat_cache_ttl
+        self._allowed_ext: Optional[FrozenSet[str]] = (
+            frozenset(e.lower() for e in allowed_extensions) if allowed_extensions else None
+        )
     
     def validate(
         self,
         value: Any,
         context: Optional[ValidationContext] = None,
     ) -> ValidationResult[Path]:
-        ctx = self._create_context(context)
-        
-        if isinstance(value, Path):
+        coerce = _PATH_COERCIONS.get(type(value))
+        if coerce is not None:
+            path_value = coerce(value)
+        elif isinstance(value, Path):
             path_value = value
         elif isinstance(value, str):
             path_value = Path(value)
@@ -977,55 +1979,63 @@ class PathValidator(BaseValidator[Path]):
                 value=value,
             )
         
+        # Contexts are only built for the issues below, never on success
         issues: List[ValidationIssue] = []
         
         if self.must_be_absolute and not path_value.is_absolute():
             issues.append(
                 self._create_issue(
                     "Path must be absolute",
-                    ctx,
+                    self._create_context(context),
                     value=path_value,
                     code="not_absolute",
                 )
             )
         
-        if self.must_exist and not path_value.exists():
+        # One stat() answers exists/is_file/is_dir
+        mode = (
+            self._stat(path_value)
+            if self.must_exist or self.must_be_file or self.must_be_dir
+            else None
+        )
+        
+        if self.must_exist and mode is None:
             issues.append(
                 self._create_issue(
                     f"Path does not exist: {path_value}",
-                    ctx,
+                    self._create_context(context),
                     value=path_value,
                     code="path_not_found",
                 )
             )
-        elif path_value.exists():
-            if self.must_be_file and not path_value.is_file():
+        elif mode is not None:
+            if self.must_be_file and not stat.S_ISREG(mode):
                 issues.append(
                     self._create_issue(
                         f"Path is not a file: {path_value}",
-                        ctx,
+                        self._create_context(context),
                         value=path_value,
                         code="not_a_file",
                     )
                 )
             
-            if self.must_be_dir and not path_value.is_dir():
+            if self.must_be_dir and not stat.S_ISDIR(mode):
                 issues.append(
                     self._create_issue(
                         f"Path is not a directory: {path_value}",
-                        ctx,
+                        self._create_context(context),
                         value=path_value,
                         code="not_a_directory",
                     )
                 )
         
-        if self.allowed_extensions:
+        if self._allowed_ext:
             ext = path_value.suffix.lower()
-            if ext not in [e.lower() for e in self.allowed_extensions]:
+            if ext not in self._allowed_ext:
                 issues.append(
                     self._create_issue(
                         f"File extension '{ext}' not allowed. Allowed: {self.allowed_extensions}",
-                        ctx,
+                        self._create_context(context),
                         value=path_value,
                         code="invalid_extension",
                     )
@@ -1034,4 +2044,17 @@ class PathValidator(BaseValidator[Path]):
         if issues:
             return ValidationResult.failure(issues, value=path_value)
         
-        return ValidationResult.success(path_value)
\ No newline at end of file
+        return ValidationResult.success(path_value)
+    
+    def _stat(self, path_value: Path) -> Optional[int]:
+        """Get the path's st_mode, from the shared cache when enabled."""
+        ttl = self.stat_cache_ttl
+        # Relative paths depend on the working directory, so never cache them
+        if not ttl or not path_value.is_absolute():
+            return _stat_mode(path_value)
+        return _cached_stat_mode(str(path_value), ttl, int(_time.monotonic() // ttl))
+    
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Clear the shared stat cache."""
+        _cached_stat_mode.cache_clear()
\ No newline at end of file
@@ -6,6 +6,8 @@ constraint enforcement and data integrity.
 
 from __future__ import annotations
 
+import functools
+import weakref
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any, Callable, Generic, TypeVar
@@ -13,6 +15,11 @@ from typing import Any, Callable, Generic, TypeVar
 from validation_infrastructure.core.base import BaseValidator, ValidationResult
 from validation_infrastructure.errors.exceptions import ValidationError
 
+try:
+    from sqlalchemy.orm import class_mapper as _sa_class_mapper
+except ImportError:
+    _sa_class_mapper = None
+
 
 T = TypeVar("T")
 
@@ -21,10 +28,13 @@ T = TypeVar("T")
 # Base Database Validator
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FieldConstraint:
     """Represents a database field constraint.
     
+    Instances are immutable, since constraints reflected from a model are
+    shared between validators.
+    
     Attributes:
         name: Constraint name.
         column: Column name.
@@ -35,14 +45,22 @@ class FieldConstraint:
     column: str
     check: Callable[[Any], bool]
     message: str = "Constraint {name} violated for {column}"
+    _formatted_message: str | None = field(default=None, init=False, repr=False, compare=False)
     
     def validate(self, value: Any) -> bool:
         """Check if value satisfies constraint."""
         return self.check(value)
     
     def get_error_message(self) -> str:
-        """Get formatted error message."""
-        return self.message.format(name=self.name, column=self.column)
+        """Get formatted error message.
+        
+        The template is formatted on first use and cached on the instance.
+        """
+        message = self._formatted_message
+        if message is None:
+            message = self.message.format(name=self.name, column=self.column)
+            object.__setattr__(self, "_formatted_message", message)
+        return message
 
 
 class DatabaseValidator(ABC, Generic[T]):
@@ -63,6 +81,13 @@ class DatabaseValidator(ABC, Generic[T]):
 # SQLAlchemy Integration
 # ============================================================================
 
+# Constraints reflected from each SQLAlchemy model class. Weak keys let
+# model classes created at runtime (e.g. in tests) be collected.
+_CONSTRAINT_CACHE: weakref.WeakKeyDictionary[type, tuple[FieldConstraint, ...]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
 class SQLAlchemyValidator(DatabaseValidator[Any]):
     """Validator for SQLAlchemy models.
     
@@ -93,21 +118,36 @@ class SQLAlchemyValidator(DatabaseValidator[Any]):
         """
         self.model_class = model_class
         self._constraints: list[FieldConstraint] = []
+        # (column, check, formatted message) per constraint, for validate_model
+        self._constraints_flat: tuple[tuple[str, Callable[[Any], bool], str], ...] = ()
         self._custom_validators: dict[str, list[Callable[[Any], bool]]] = {}
         
         # Extract constraints from model
         self._extract_constraints()
+        self._constraints_flat = tuple(
+            (c.column, c.check, c.get_error_message()) for c in self._constraints
+        )
+        # Same entries grouped by column, for validate_field
+        self._constraints_by_column: dict[str, list[tuple[Callable[[Any], bool], str]]] = {}
+        for column, check, message in self._constraints_flat:
+            self._constraints_by_column.setdefault(column, []).append((check, message))
     
     def _extract_constraints(self) -> None:
-        """Extract constraints from SQLAlchemy model."""
-        try:
-            from sqlalchemy import inspect
-            from sqlalchemy.orm import class_mapper
-        except ImportError:
+        """Extract constraints from SQLAlchemy model.
+        
+        Constraints are reflected once per model class and shared by later
+        validators for the same class.
+        """
+        cached = _CONSTRAINT_CACHE.get(self.model_class)
+        if cached is not None:
+            self._constraints = list(cached)
+            return
+        
+        if _sa_class_mapper is None:
             return
         
         try:
-            mapper = class_mapper(self.model_class)
+            mapper = _sa_class_mapper(self.model_class)
         except Exception:
             return
         
@@ -130,6 +170,8 @@ class SQLAlchemyValidator(DatabaseValidator[Any]):
                     check=lambda v, ml=max_len: v is None or len(str(v)) <= ml,
                     message=f"Field '{column.name}' exceeds max length {max_len}",
                 ))
+        
+        _CONSTRAINT_CACHE[self.model_class] = tuple(self._constraints)
     
     def add_validator(
         self,
@@ -160,19 +202,19 @@ class SQLAlchemyValidator(DatabaseValidator[Any]):
             ValidationResult with errors.
         """
         errors: list[str] = []
+        errors_append = errors.append
         
         # Check constraints
-        for constraint in self._constraints:
-            value = getattr(instance, constraint.column, None)
-            if not constraint.validate(value):
-                errors.append(constraint.get_error_message())
+        for column, check, message in self._constraints_flat:
+            if not check(getattr(instance, column, None)):
+                errors_append(message)
         
         # Check custom validators
         for field_name, validators in self._custom_validators.items():
             value = getattr(instance, field_name, None)
             for validator in validators:
                 if not validator(value):
-                    errors.append(f"Custom validation failed for '{field_name}'")
+                    errors_append(f"Custom validation failed for '{field_name}'")
         
         return ValidationResult(
             is_valid=len(errors) == 0,
@@ -190,17 +232,17 @@ class SQLAlchemyValidator(DatabaseValidator[Any]):
             ValidationResult with errors.
         """
         errors: list[str] = []
+        errors_append = errors.append
         
         # Check constraints for this field
-        for constraint in self._constraints:
-            if constraint.column == field_name:
-                if not constraint.validate(value):
-                    errors.append(constraint.get_error_message())
+        for check, message in self._constraints_by_column.get(field_name, ()):
+            if not check(value):
+                errors_append(message)
         
         # Check custom validators
         for validator in self._custom_validators.get(field_name, []):
             if not validator(value):
-                errors.append(f"Custom validation failed for '{field_name}'")
+                errors_append(f"Custom validation failed for '{field_name}'")
         
         return ValidationResult(
             is_valid=len(errors) == 0,
@@ -277,6 +319,28 @@ class DjangoValidator(DatabaseValidator[Any]):
         """
         self.model_class = model_class
         self._custom_validators: dict[str, list[Callable[[Any], bool]]] = {}
+        # field name -> (validators, null allowed, max_length) from _meta
+        self._field_cache: dict[str, tuple[tuple[Callable[[Any], Any], ...], bool, Any]] = {}
+    
+    def _field_spec(
+        self,
+        field_name: str,
+    ) -> tuple[tuple[Callable[[Any], Any], ...], bool, Any]:
+        """Resolve and cache what validate_field needs from a model field.
+        
+        Raises whatever ``_meta.get_field`` raises; failed lookups are not
+        cached.
+        """
+        spec = self._field_cache.get(field_name)
+        if spec is None:
+            model_field = self.model_class._meta.get_field(field_name)
+            spec = (
+                tuple(model_field.validators),
+                model_field.null,
+                getattr(model_field, "max_length", None),
+            )
+            self._field_cache[field_name] = spec
+        return spec
     
     def add_validator(
         self,
@@ -309,6 +373,7 @@ class DjangoValidator(DatabaseValidator[Any]):
             ValidationResult with errors.
         """
         errors: list[str] = []
+        errors_append = errors.append
         
         # Use Django's validation
         try:
@@ -316,20 +381,22 @@ class DjangoValidator(DatabaseValidator[Any]):
         except Exception as e:
             # Django ValidationError has a message_dict or messages
             if hasattr(e, "message_dict"):
-                for field, messages in e.message_dict.items():
-                    for msg in messages:
-                        errors.append(f"{field}: {msg}")
+                errors.extend(
+                    f"{field}: {msg}"
+                    for field, messages in e.message_dict.items()
+                    for msg in messages
+                )
             elif hasattr(e, "messages"):
                 errors.extend(e.messages)
             else:
-                errors.append(str(e))
+                errors_append(str(e))
         
         # Custom validators
         for field_name, validators in self._custom_validators.items():
             value = getattr(instance, field_name, None)
             for validator in validators:
                 if not validator(value):
-                    errors.append(f"Custom validation failed for '{field_name}'")
+                    errors_append(f"Custom validation failed for '{field_name}'")
         
         return ValidationResult(
             is_valid=len(errors) == 0,
@@ -347,27 +414,28 @@ class DjangoValidator(DatabaseValidator[Any]):
             ValidationResult.
         """
         errors: list[str] = []
+        errors_append = errors.append
         
         # Get field from model
         try:
-            model_field = self.model_class._meta.get_field(field_name)
+            validators, null_allowed, max_length = self._field_spec(field_name)
             
             # Run field validators
-            for validator in model_field.validators:
+            for validator in validators:
                 try:
                     validator(value)
                 except Exception as e:
-                    errors.append(str(e))
+                    errors_append(str(e))
             
             # Check null constraint
-            if not model_field.null and value is None:
-                errors.append(f"Field '{field_name}' cannot be null")
+            if not null_allowed and value is None:
+                errors_append(f"Field '{field_name}' cannot be null")
             
             # Check max_length for char fields
-            if hasattr(model_field, "max_length") and model_field.max_length:
-                if value and len(str(value)) > model_field.max_length:
-                    errors.append(
-                        f"Field '{field_name}' exceeds max length {model_field.max_length}"
+            if max_length:
+                if value and len(str(value)) > max_length:
+                    errors_append(
+                        f"Field '{field_name}' exceeds max length {max_length}"
                     )
         
         except Exception:
@@ -376,7 +444,7 @@ class DjangoValidator(DatabaseValidator[Any]):
         # Custom validators
         for validator in self._custom_validators.get(field_name, []):
             if not validator(value):
-                errors.append(f"Custom validation failed for '{field_name}'")
+                errors_append(f"Custom validation failed for '{field_name}'")
         
         return ValidationResult(
             is_valid=len(errors) == 0,
@@ -388,6 +456,14 @@ class DjangoValidator(DatabaseValidator[Any]):
 # Generic Database Validators
 # ============================================================================
 
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
 class UniqueValidator(BaseValidator[tuple[Any, str, Any]]):
     """Validates uniqueness against a database.
     
@@ -397,14 +473,30 @@ class UniqueValidator(BaseValidator[tuple[Any, str, Any]]):
     def __init__(
         self,
         query_fn: Callable[[str, Any], bool],
+        bulk_query_fn: Callable[[str, list[Any]], set[Any]] | None = None,
+        bloom: Any | None = None,
     ) -> None:
         """Initialize validator.
         
         Args:
             query_fn: Function that checks if value exists.
                       Takes (field_name, value) and returns bool.
+            bulk_query_fn: Optional function for validate_many. Takes
+                      (field_name, values) and returns the subset of values
+                      that already exist, e.g. via one ``IN`` query.
+            bloom: Optional Bloom filter (any object supporting ``in`` and
+                      ``add``, e.g. ``pybloom_live.ScalableBloomFilter``)
+                      holding every stored value. Values it rules out skip
+                      the database query. Keep it current with add().
         """
         self.query_fn = query_fn
+        self.bulk_query_fn = bulk_query_fn
+        self.bloom = bloom
+    
+    def add(self, value: Any) -> None:
+        """Record a stored value in the Bloom filter, if one is set."""
+        if self.bloom is not None:
+            self.bloom.add(value)
     
     def validate(
         self,
@@ -422,13 +514,63 @@ class UniqueValidator(BaseValidator[tuple[Any, str, Any]]):
         """
         _, field_name, field_value = value
         
+        # Definitely never stored: no need to ask the database
+        if self.bloom is not None and field_value not in self.bloom:
+            return ValidationResult(is_valid=True)
+        
         if self.query_fn(field_name, field_value):
-            return ValidationResult(
-                is_valid=False,
-                errors=[f"Value already exists for '{field_name}'"],
-            )
+            return self._duplicate_result(field_name)
         
         return ValidationResult(is_valid=True)
+    
+    def validate_many(
+        self,
+        items: list[tuple[Any, str, Any]],
+    ) -> list[ValidationResult]:
+        """Validate uniqueness for a batch of inputs.
+        
+        With ``bulk_query_fn`` set, existence is resolved with one call per
+        distinct field name instead of one per item.
+        
+        Args:
+            items: Tuples of (instance, field_name, value).
+        
+        Returns:
+            One ValidationResult per item, in input order.
+        """
+        if self.bulk_query_fn is None:
+            return [self.validate(item) for item in items]
+        
+        bloom = self.bloom
+        results: list[ValidationResult | None] = [None] * len(items)
+        values_by_field: dict[str, dict[Any, None]] = {}
+        for i, item in enumerate(items):
+            _, field_name, field_value = item
+            if not _is_hashable(field_value):
+                # e.g. a JSON list or dict column: cannot join the bulk lookup
+                results[i] = self.validate(item)
+            elif bloom is None or field_value in bloom:
+                values_by_field.setdefault(field_name, {})[field_value] = None
+        
+        existing_by_field = {
+            field_name: self.bulk_query_fn(field_name, list(values))
+            for field_name, values in values_by_field.items()
+        }
+        
+        for i, (_, field_name, field_value) in enumerate(items):
+            if results[i] is None:
+                results[i] = (
+                    self._duplicate_result(field_name)
+                    if field_value in existing_by_field.get(field_name, ())
+                    else ValidationResult(is_valid=True)
+                )
+        return results  # type: ignore[return-value]
+    
+    def _duplicate_result(self, field_name: str) -> ValidationResult:
+        return ValidationResult(
+            is_valid=False,
+            errors=[f"Value already exists for '{field_name}'"],
+        )
 
 
 class ForeignKeyValidator(BaseValidator[tuple[str, Any]]):
@@ -437,14 +579,26 @@ class ForeignKeyValidator(BaseValidator[tuple[str, Any]]):
     def __init__(
         self,
         exists_fn: Callable[[str, Any], bool],
+        bulk_exists_fn: Callable[[str, list[Any]], set[Any]] | None = None,
+        cache_size: int = 0,
     ) -> None:
         """Initialize validator.
         
         Args:
             exists_fn: Function that checks if referenced record exists.
                        Takes (table_name, id) and returns bool.
+            bulk_exists_fn: Optional function for validate_many. Takes
+                       (table_name, ids) and returns the subset of ids that
+                       exist, e.g. via one ``IN`` query.
+            cache_size: If positive, memoize exists_fn per (table_name, id)
+                       in an LRU cache of this size. Cached answers do not
+                       see later inserts or deletes until clear_cache().
         """
         self.exists_fn = exists_fn
+        self.bulk_exists_fn = bulk_exists_fn
+        self._cached_exists: Callable[[str, Any], bool] | None = (
+            functools.lru_cache(maxsize=cache_size)(exists_fn) if cache_size > 0 else None
+        )
     
     def validate(
         self,
@@ -465,10 +619,68 @@ class ForeignKeyValidator(BaseValidator[tuple[str, Any]]):
         if fk_id is None:
             return ValidationResult(is_valid=True)
         
-        if not self.exists_fn(table_name, fk_id):
-            return ValidationResult(
-                is_valid=False,
-                errors=[f"Referenced {table_name} with id={fk_id} does not exist"],
-            )
+        if not self._exists(table_name, fk_id):
+            return self._missing_result(table_name, fk_id)
         
         return ValidationResult(is_valid=True)
+    
+    def validate_many(
+        self,
+        items: list[tuple[str, Any]],
+    ) -> list[ValidationResult]:
+        """Validate a batch of foreign key references.
+        
+        With ``bulk_exists_fn`` set, existence is resolved with one call per
+        referenced table instead of one per item.
+        
+        Args:
+            items: Tuples of (table_name, foreign_key_id).
+        
+        Returns:
+            One ValidationResult per item, in input order.
+        """
+        if self.bulk_exists_fn is None:
+            return [self.validate(item) for item in items]
+        
+        results: list[ValidationResult | None] = [None] * len(items)
+        ids_by_table: dict[str, dict[Any, None]] = {}
+        for i, item in enumerate(items):
+            table_name, fk_id = item
+            if fk_id is None:
+                results[i] = ValidationResult(is_valid=True)
+            elif not _is_hashable(fk_id):
+                # Cannot join the bulk lookup: checked on its own
+                results[i] = self.validate(item)
+            else:
+                ids_by_table.setdefault(table_name, {})[fk_id] = None
+        
+        existing_by_table = {
+            table_name: self.bulk_exists_fn(table_name, list(ids))
+            for table_name, ids in ids_by_table.items()
+        }
+        
+        for i, (table_name, fk_id) in enumerate(items):
+            if results[i] is None:
+                results[i] = (
+                    ValidationResult(is_valid=True)
+                    if fk_id in existing_by_table[table_name]
+                    else self._missing_result(table_name, fk_id)
+                )
+        return results  # type: ignore[return-value]
+    
+    def clear_cache(self) -> None:
+        """Forget cached exists_fn answers."""
+        if self._cached_exists is not None:
+            self._cached_exists.cache_clear()  # type: ignore[attr-defined]
+    
+    def _exists(self, table_name: str, fk_id: Any) -> bool:
+        # Unhashable ids cannot be cached
+        if self._cached_exists is not None and _is_hashable(fk_id):
+            return self._cached_exists(table_name, fk_id)
+        return self.exists_fn(table_name, fk_id)
+    
+    def _missing_result(self, table_name: str, fk_id: Any) -> ValidationResult:
+        return ValidationResult(
+            is_valid=False,
+            errors=[f"Referenced {table_name} with id={fk_id} does not exist"],
+        )
@@ -2,15 +2,25 @@
 
 from __future__ import annotations
 
-import asyncio
+import contextvars
+import dis
 import functools
 import inspect
+import operator
+import os
 from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
 
 from validation_infrastructure.errors.exceptions import ValidationError, ValidationErrorCollection
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+# Set VALIDATION_DISABLE_CONTRACTS=1 to leave decorated code unwrapped
+_CONTRACTS_ENABLED = os.environ.get("VALIDATION_DISABLE_CONTRACTS", "").lower() not in (
+    "1",
+    "true",
+    "yes",
+)
+
 
 class ContractViolation(ValidationError):
     """Raised when a design contract is violated."""
@@ -23,11 +33,15 @@ class ContractViolation(ValidationError):
         function_name: str,
         value: Any = None,
     ):
+        code = _VIOLATION_CODES.get(contract_type) or f"{contract_type.lower()}_violation"
         super().__init__(
-            message=f"{contract_type} contract '{condition_name}' violated in {function_name}: {message}",
-            code=f"{contract_type.lower()}_violation",
-            value=value,
-            context={
+            f"{contract_type} contract '{condition_name}' violated in {function_name}: {message}",
+            code,
+            None,
+            None,
+            value,
+            None,
+            {
                 "contract_type": contract_type,
                 "condition_name": condition_name,
                 "function_name": function_name,
@@ -36,6 +50,47 @@ class ContractViolation(ValidationError):
         self.contract_type = contract_type
         self.condition_name = condition_name
         self.function_name = function_name
+    
+    @classmethod
+    def precondition(
+        cls, condition_name: str, message: str, function_name: str, value: Any = None
+    ) -> ContractViolation:
+        """Violation of a requires() condition."""
+        return cls("Precondition", condition_name, message, function_name, value)
+    
+    @classmethod
+    def postcondition(
+        cls, condition_name: str, message: str, function_name: str, value: Any = None
+    ) -> ContractViolation:
+        """Violation of an ensures() condition."""
+        return cls("Postcondition", condition_name, message, function_name, value)
+    
+    @classmethod
+    def invariant(
+        cls, condition_name: str, message: str, class_name: str, value: Any = None
+    ) -> ContractViolation:
+        """Violation of a class invariant."""
+        return cls("Invariant", condition_name, message, class_name, value)
+
+
+_VIOLATION_CODES = {
+    "Precondition": "precondition_violation",
+    "Postcondition": "postcondition_violation",
+    "Invariant": "invariant_violation",
+}
+
+
+# OldValue captured by the innermost active @captures call
+_OLD_VALUES: contextvars.ContextVar[Optional[OldValue]] = contextvars.ContextVar(
+    "_OLD_VALUES", default=None
+)
+
+# How a condition's predicate takes the decorated function's arguments
+_CALL_KEYWORDS = 0
+_CALL_POSITIONAL = 1
+_CALL_RESULT_ONLY = 2
+
+_NO_EXTRA: Dict[str, Any] = {}
 
 
 class Condition:
@@ -50,19 +105,274 @@ class Condition:
         self.predicate = predicate
         self.message = message or "Condition not satisfied"
         self.name = name or getattr(predicate, "__name__", "unnamed")
+        self._signature: Optional[inspect.Signature] = None
+    
+    def signature(self) -> Optional[inspect.Signature]:
+        """The predicate's signature, or None if it cannot be inspected."""
+        if self._signature is None:
+            try:
+                self._signature = inspect.signature(self.predicate)
+            except (TypeError, ValueError):
+                return None
+        return self._signature
     
-    def check(self, *args: Any, **kwargs: Any) -> tuple[bool, str]:
+    def check(self, /, *args: Any, **kwargs: Any) -> tuple[bool, str]:
         """Check if condition is satisfied."""
         try:
             result = self.predicate(*args, **kwargs)
             return result, self.message
         except Exception as e:
-            return False, f"{self.message} (error: {e})"
+            return False, self.error_message(e)
+    
+    def error_message(self, error: Exception) -> str:
+        """Failure message for a predicate that raised."""
+        return f"{self.message} (error: {error})"
+    
+    def call_mode(
+        self,
+        names: List[str],
+        with_result: bool = False,
+        extra: tuple = (),
+    ) -> int:
+        """Work out once how the predicate accepts the given argument names.
+        
+        Keywords are preferred; otherwise the call's own positional
+        arguments are passed, or just the result for postconditions whose
+        predicate takes nothing else. Names in ``extra`` are always passed
+        as keywords on top of that.
+        """
+        psig = self.signature()
+        if psig is None:
+            return _CALL_KEYWORDS
+        
+        lead = (None,) if with_result else ()
+        always = dict.fromkeys(extra)
+        if _binds(psig, *lead, **dict.fromkeys(names), **always):
+            return _CALL_KEYWORDS
+        if with_result and _binds(psig, None, **always) and not _binds(psig, None, None, **always):
+            return _CALL_RESULT_ONLY
+        return _CALL_POSITIONAL
+    
+    def takes_old(self) -> bool:
+        """Whether the predicate names an ``old`` parameter for captured values."""
+        psig = self.signature()
+        param = psig.parameters.get("old") if psig is not None else None
+        return param is not None and param.kind in (
+            param.POSITIONAL_OR_KEYWORD,
+            param.KEYWORD_ONLY,
+        )
+
+
+def _bind_arguments(sig: inspect.Signature, args: tuple, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a call's arguments to parameter names, defaults included."""
+    bound = sig.bind(*args, **kwargs)
+    bound.apply_defaults()
+    return bound.arguments
+
+
+def _binds(sig: inspect.Signature, *args: Any, **kwargs: Any) -> bool:
+    """Whether the signature accepts the given arguments."""
+    try:
+        sig.bind(*args, **kwargs)
+    except TypeError:
+        return False
+    return True
+
+
+def _condition_lines(
+    conditions: List[Condition],
+    namespace: Dict[str, Any],
+    call_args: List[str],
+    value: str,
+    violate: str = "_vi_violate",
+    tag: str = "",
+) -> List[str]:
+    """Unrolled source checking each condition in turn, for generated wrappers.
+    
+    ``call_args`` holds each predicate's argument source; a failing
+    condition calls ``violate(condition, message, value)``. ``tag`` keeps
+    the names of several condition groups in one wrapper apart.
+    """
+    lines: List[str] = []
+    for i, (condition, args) in enumerate(zip(conditions, call_args, strict=True)):
+        c, p = f"_vi_c{tag}{i}", f"_vi_p{tag}{i}"
+        namespace[c] = condition
+        namespace[p] = condition.predicate
+        lines += [
+            "    try:",
+            f"        _vi_ok = {p}({args})",
+            "    except Exception as _vi_e:",
+            f"        _vi_ok, _vi_msg = False, {c}.error_message(_vi_e)",
+            "    else:",
+            f"        _vi_msg = {c}.message",
+            f"    if not _vi_ok: {violate}({c}, _vi_msg, {value})",
+        ]
+    return lines
+
+
+def _signature_source(
+    sig: inspect.Signature,
+    namespace: Dict[str, Any],
+) -> Optional[tuple[str, str, str]]:
+    """Build source fragments mirroring a signature, for generated wrappers.
+    
+    The fragments are the wrapper's parameter list, its call to the wrapped
+    function and a keyword pass-through of every parameter. Returns None
+    unless all parameters are plain or keyword-only.
+    """
+    params = list(sig.parameters.values())
+    if any(
+        p.kind not in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY)
+        or p.name.startswith("_vi_")
+        for p in params
+    ):
+        return None
+    
+    signature: List[str] = []
+    call: List[str] = []
+    keyword_only = False
+    for i, p in enumerate(params):
+        if p.kind is p.KEYWORD_ONLY and not keyword_only:
+            signature.append("*")
+            keyword_only = True
+        if p.default is p.empty:
+            signature.append(p.name)
+        else:
+            namespace[f"_vi_d{i}"] = p.default
+            signature.append(f"{p.name}=_vi_d{i}")
+        call.append(f"{p.name}={p.name}" if keyword_only else p.name)
+    
+    keywords = ", ".join(f"{p.name}={p.name}" for p in params)
+    return ", ".join(signature), ", ".join(call), keywords
+
+
+def _postcondition_checks(
+    conditions: List[Condition],
+    names: List[str],
+) -> List[tuple[Condition, int, bool]]:
+    """(condition, call mode, wants old values) for each postcondition."""
+    checks = []
+    for c in conditions:
+        # Predicates naming 'old' get the values from an outer @captures
+        wants_old = "old" not in names and c.takes_old()
+        extra = ("old",) if wants_old else ()
+        checks.append((c, c.call_mode(names, with_result=True, extra=extra), wants_old))
+    return checks
+
+
+def _compile_contract_wrapper(
+    func: Callable[..., Any],
+    sig: inspect.Signature,
+    preconditions: List[tuple[Condition, int]],
+    postconditions: List[tuple[Condition, int, bool]],
+    violate_pre: Optional[Callable[[Condition, str, Dict[str, Any]], None]] = None,
+    violate_post: Optional[Callable[[Condition, str, Any], None]] = None,
+) -> Optional[Callable[..., Any]]:
+    """Generate a wrapper taking func's exact parameters, or None if unsupported.
+    
+    Preconditions run before the single call to func and postconditions
+    after it. Every predicate must take the arguments by name (or, for
+    postconditions, the result alone) and func may only have plain or
+    keyword-only parameters; anything else uses the generic wrappers.
+    """
+    if any(mode != _CALL_KEYWORDS for _, mode in preconditions) or any(
+        mode == _CALL_POSITIONAL for _, mode, _ in postconditions
+    ):
+        return None
+    namespace: Dict[str, Any] = {
+        "_vi_func": func,
+        "_vi_violate_pre": violate_pre,
+        "_vi_violate_post": violate_post,
+        "_vi_old_values": _OLD_VALUES,
+    }
+    source = _signature_source(sig, namespace)
+    if source is None:
+        return None
+    signature, call, keywords = source
+    
+    is_async = inspect.iscoroutinefunction(func)
+    lines = [f"{'async ' if is_async else ''}def _vi_wrapper({signature}):"]
+    if preconditions:
+        arguments = "{" + ", ".join(f"{name!r}: {name}" for name in sig.parameters) + "}"
+        lines += _condition_lines(
+            [c for c, _ in preconditions],
+            namespace,
+            [keywords] * len(preconditions),
+            arguments,
+            violate="_vi_violate_pre",
+            tag="r",
+        )
+    lines.append(f"    _vi_result = {'await ' if is_async else ''}_vi_func({call})")
+    if postconditions:
+        call_args = []
+        for _, mode, wants_old in postconditions:
+            args = ["_vi_result"]
+            if mode == _CALL_KEYWORDS and keywords:
+                args.append(keywords)
+            if wants_old:
+                args.append("old=_vi_old")
+            call_args.append(", ".join(args))
+        if any(wants_old for _, _, wants_old in postconditions):
+            lines.append("    _vi_old = _vi_old_values.get()")
+        lines += _condition_lines(
+            [c for c, _, _ in postconditions],
+            namespace,
+            call_args,
+            "_vi_result",
+            violate="_vi_violate_post",
+            tag="e",
+        )
+    lines.append("    return _vi_result")
+    
+    exec(compile("\n".join(lines), f"<contract {func.__qualname__}>", "exec"), namespace)
+    return functools.wraps(func)(namespace["_vi_wrapper"])
+
+
+def _is_trivially_true(predicate: Callable[..., Any]) -> bool:
+    """Whether predicate is a function whose body is just ``return True``."""
+    code = getattr(predicate, "__code__", None)
+    if code is None:
+        return False
+    ops = [
+        (ins.opname, ins.argval)
+        for ins in dis.get_instructions(code)
+        if ins.opname not in ("RESUME", "NOP", "CACHE")
+    ]
+    return ops in ([("LOAD_CONST", True), ("RETURN_VALUE", None)], [("RETURN_CONST", True)])
+
+
+def _predicate_cost(predicate: Callable[..., Any]) -> int:
+    """Rough evaluation cost: the size of the predicate's bytecode."""
+    code = getattr(predicate, "__code__", None)
+    return len(code.co_code) if code is not None else 0
+
+
+def _parse_conditions(
+    conditions: tuple,
+    message: Optional[str],
+    reorder: bool,
+) -> List[Condition]:
+    """Wrap predicates as Conditions, dropping ones that always hold.
+    
+    With reorder, cheaper predicates are moved ahead of expensive ones so
+    that failures are found sooner; otherwise declaration order is kept.
+    """
+    parsed_conditions: List[Condition] = []
+    for cond in conditions:
+        if not isinstance(cond, Condition):
+            cond = Condition(cond, message=message)
+        if not _is_trivially_true(cond.predicate):
+            parsed_conditions.append(cond)
+    
+    if reorder:
+        parsed_conditions.sort(key=lambda c: _predicate_cost(c.predicate))
+    return parsed_conditions
 
 
 def requires(
     *conditions: Union[Callable[..., bool], Condition],
     message: Optional[str] = None,
+    reorder: bool = False,
 ) -> Callable[[F], F]:
     """
     Decorator specifying preconditions for a function.
@@ -72,6 +382,7 @@ def requires(
     Args:
         conditions: Predicates that must return True
         message: Optional custom error message
+        reorder: Check cheaper predicates first instead of in declaration order
     
     Example:
         @requires(lambda x: x > 0, message="x must be positive")
@@ -85,67 +396,76 @@ def requires(
         def process_items(items: List[int]) -> int:
             return sum(items)
     """
-    parsed_conditions: List[Condition] = []
-    for cond in conditions:
-        if isinstance(cond, Condition):
-            parsed_conditions.append(cond)
-        else:
-            parsed_conditions.append(Condition(cond, message=message))
+    parsed_conditions = _parse_conditions(conditions, message, reorder)
     
     def decorator(func: F) -> F:
+        if not _CONTRACTS_ENABLED:
+            return func
         func_name = func.__qualname__
+        # Get argument names for better error messages
+        sig = inspect.signature(func)
+        names = list(sig.parameters)
+        checks = [(c, c.call_mode(names)) for c in parsed_conditions]
+        needs_bound = any(mode == _CALL_KEYWORDS for _, mode in checks)
         
-        @functools.wraps(func)
-        def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Get argument names for better error messages
-            sig = inspect.signature(func)
-            bound = sig.bind(*args, **kwargs)
-            bound.apply_defaults()
-            
-            for condition in parsed_conditions:
-                # Try calling with bound arguments first
-                try:
-                    satisfied, msg = condition.check(**bound.arguments)
-                except TypeError:
-                    # Fall back to positional args
-                    satisfied, msg = condition.check(*args, **kwargs)
+        def violate(condition: Condition, msg: str, arguments: Dict[str, Any]) -> None:
+            raise ContractViolation.precondition(condition.name, msg, func_name, arguments)
+        
+        # Specialise to func's own parameters when every predicate takes them by name
+        compiled = _compile_contract_wrapper(func, sig, checks, [], violate_pre=violate)
+        if compiled is not None:
+            return compiled  # type: ignore
+        
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                arguments = _bind_arguments(sig, args, kwargs) if needs_bound else None
                 
-                if not satisfied:
-                    raise ContractViolation(
-                        contract_type="Precondition",
-                        condition_name=condition.name,
-                        message=msg,
-                        function_name=func_name,
-                        value=bound.arguments,
-                    )
-            
-            return func(*args, **kwargs)
+                for condition, mode in checks:
+                    try:
+                        if mode == _CALL_KEYWORDS:
+                            satisfied = condition.predicate(**arguments)
+                        else:
+                            satisfied = condition.predicate(*args, **kwargs)
+                    except Exception as e:
+                        satisfied, msg = False, condition.error_message(e)
+                    else:
+                        msg = condition.message
+                    
+                    if not satisfied:
+                        if arguments is None:
+                            arguments = _bind_arguments(sig, args, kwargs)
+                        raise ContractViolation.precondition(
+                            condition.name, msg, func_name, arguments
+                        )
+                
+                return await func(*args, **kwargs)
+            return async_wrapper  # type: ignore
         
         @functools.wraps(func)
-        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            sig = inspect.signature(func)
-            bound = sig.bind(*args, **kwargs)
-            bound.apply_defaults()
+        def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+            # Only bind when some predicate takes arguments by name
+            arguments = _bind_arguments(sig, args, kwargs) if needs_bound else None
             
-            for condition in parsed_conditions:
+            for condition, mode in checks:
+                # Bound arguments by name, or the call's own positionals
                 try:
-                    satisfied, msg = condition.check(**bound.arguments)
-                except TypeError:
-                    satisfied, msg = condition.check(*args, **kwargs)
+                    if mode == _CALL_KEYWORDS:
+                        satisfied = condition.predicate(**arguments)
+                    else:
+                        satisfied = condition.predicate(*args, **kwargs)
+                except Exception as e:
+                    satisfied, msg = False, condition.error_message(e)
+                else:
+                    msg = condition.message
                 
                 if not satisfied:
-                    raise ContractViolation(
-                        contract_type="Precondition",
-                        condition_name=condition.name,
-                        message=msg,
-                        function_name=func_name,
-                        value=bound.arguments,
-                    )
+                    if arguments is None:
+                        arguments = _bind_arguments(sig, args, kwargs)
+                    raise ContractViolation.precondition(condition.name, msg, func_name, arguments)
             
-            return await func(*args, **kwargs)
+            return func(*args, **kwargs)
         
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper  # type: ignore
         return sync_wrapper  # type: ignore
     
     return decorator
@@ -154,6 +474,7 @@ def requires(
 def ensures(
     *conditions: Union[Callable[..., bool], Condition],
     message: Optional[str] = None,
+    reorder: bool = False,
 ) -> Callable[[F], F]:
     """
     Decorator specifying postconditions for a function.
@@ -164,6 +485,7 @@ def ensures(
     Args:
         conditions: Predicates receiving (result, *args, **kwargs)
         message: Optional custom error message
+        reorder: Check cheaper predicates first instead of in declaration order
     
     Example:
         @ensures(lambda result: result >= 0, message="Result must be non-negative")
@@ -174,75 +496,111 @@ def ensures(
         def count_positive(items: List[int]) -> int:
             return sum(1 for i in items if i > 0)
     """
-    parsed_conditions: List[Condition] = []
-    for cond in conditions:
-        if isinstance(cond, Condition):
-            parsed_conditions.append(cond)
-        else:
-            parsed_conditions.append(Condition(cond, message=message))
+    parsed_conditions = _parse_conditions(conditions, message, reorder)
     
     def decorator(func: F) -> F:
+        if not _CONTRACTS_ENABLED:
+            return func
         func_name = func.__qualname__
+        sig = inspect.signature(func)
+        names = list(sig.parameters)
+        checks = _postcondition_checks(parsed_conditions, names)
+        needs_bound = any(mode == _CALL_KEYWORDS for _, mode, _ in checks)
+        needs_old = any(wants_old for _, _, wants_old in checks)
         
-        @functools.wraps(func)
-        def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-            result = func(*args, **kwargs)
-            
-            for condition in parsed_conditions:
-                # Try with result + kwargs first
-                try:
-                    sig = inspect.signature(func)
-                    bound = sig.bind(*args, **kwargs)
-                    bound.apply_defaults()
-                    satisfied, msg = condition.check(result, **bound.arguments)
-                except TypeError:
-                    # Fall back to result + args
+        def evaluate(
+            predicate: Callable[..., bool],
+            mode: int,
+            result: Any,
+            arguments: Optional[Dict[str, Any]],
+            args: tuple,
+            kwargs: Dict[str, Any],
+            extra: Dict[str, Any],
+        ) -> Any:
+            if mode == _CALL_KEYWORDS and arguments is not None:
+                return predicate(result, **arguments, **extra)
+            if mode == _CALL_RESULT_ONLY:
+                return predicate(result, **extra)
+            return predicate(result, *args, **kwargs, **extra)
+        
+        def old_values() -> Dict[str, Any]:
+            return {"old": _OLD_VALUES.get()} if needs_old else {}
+        
+        def violate(condition: Condition, msg: str, result: Any) -> None:
+            raise ContractViolation.postcondition(condition.name, msg, func_name, result)
+        
+        # Specialise to func's own parameters when no predicate needs positionals
+        compiled = _compile_contract_wrapper(func, sig, [], checks, violate_post=violate)
+        if compiled is not None:
+            return compiled  # type: ignore
+        
+        def bind_arguments(args: tuple, kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            if not needs_bound:
+                return None
+            try:
+                return _bind_arguments(sig, args, kwargs)
+            except TypeError:
+                return None
+        
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                result = await func(*args, **kwargs)
+                arguments = bind_arguments(args, kwargs)
+                old = old_values()
+                
+                for condition, mode, wants_old in checks:
                     try:
-                        satisfied, msg = condition.check(result, *args, **kwargs)
-                    except TypeError:
-                        # Just result
-                        satisfied, msg = condition.check(result)
+                        satisfied = evaluate(
+                            condition.predicate,
+                            mode,
+                            result,
+                            arguments,
+                            args,
+                            kwargs,
+                            old if wants_old else _NO_EXTRA,
+                        )
+                    except Exception as e:
+                        satisfied, msg = False, condition.error_message(e)
+                    else:
+                        msg = condition.message
+                    
+                    if not satisfied:
+                        raise ContractViolation.postcondition(
+                            condition.name, msg, func_name, result
+                        )
                 
-                if not satisfied:
-                    raise ContractViolation(
-                        contract_type="Postcondition",
-                        condition_name=condition.name,
-                        message=msg,
-                        function_name=func_name,
-                        value=result,
-                    )
-            
-            return result
+                return result
+            return async_wrapper  # type: ignore
         
         @functools.wraps(func)
-        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            result = await func(*args, **kwargs)
+        def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+            result = func(*args, **kwargs)
+            # Bound once per call and shared by every condition
+            arguments = bind_arguments(args, kwargs)
+            old = old_values()
             
-            for condition in parsed_conditions:
+            for condition, mode, wants_old in checks:
                 try:
-                    sig = inspect.signature(func)
-                    bound = sig.bind(*args, **kwargs)
-                    bound.apply_defaults()
-                    satisfied, msg = condition.check(result, **bound.arguments)
-                except TypeError:
-                    try:
-                        satisfied, msg = condition.check(result, *args, **kwargs)
-                    except TypeError:
-                        satisfied, msg = condition.check(result)
+                    satisfied = evaluate(
+                        condition.predicate,
+                        mode,
+                        result,
+                        arguments,
+                        args,
+                        kwargs,
+                        old if wants_old else _NO_EXTRA,
+                    )
+                except Exception as e:
+                    satisfied, msg = False, condition.error_message(e)
+                else:
+                    msg = condition.message
                 
                 if not satisfied:
-                    raise ContractViolation(
-                        contract_type="Postcondition",
-                        condition_name=condition.name,
-                        message=msg,
-                        function_name=func_name,
-                        value=result,
-                    )
+                    raise ContractViolation.postcondition(condition.name, msg, func_name, result)
             
             return result
         
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper  # type: ignore
         return sync_wrapper  # type: ignore
     
     return decorator
@@ -270,45 +628,46 @@ def invariant(
             def withdraw(self, amount: float) -> None:
                 self.balance -= amount
     """
-    parsed_conditions: List[Condition] = []
-    for cond in conditions:
-        if isinstance(cond, Condition):
-            parsed_conditions.append(cond)
-        else:
-            parsed_conditions.append(Condition(cond, message=message))
-    
-    def check_invariants(instance: Any, class_name: str) -> None:
-        """Check all invariants on the instance."""
-        for condition in parsed_conditions:
-            satisfied, msg = condition.check(instance)
-            if not satisfied:
-                raise ContractViolation(
-                    contract_type="Invariant",
-                    condition_name=condition.name,
-                    message=msg,
-                    function_name=class_name,
-                    value=instance,
-                )
-    
-    def wrap_method(method: Callable[..., Any], class_name: str) -> Callable[..., Any]:
+    parsed_conditions = _parse_conditions(conditions, message, reorder=False)
+    
+    def compile_check(class_name: str) -> Callable[[Any], None]:
+        """Build an unrolled checker for all invariants of one class."""
+        def violate(condition: Condition, msg: str, instance: Any) -> None:
+            raise ContractViolation.invariant(condition.name, msg, class_name, instance)
+        
+        namespace: Dict[str, Any] = {"_vi_violate": violate}
+        lines = ["def _vi_check(_vi_self):"]
+        lines += _condition_lines(
+            parsed_conditions, namespace, ["_vi_self"] * len(parsed_conditions), "_vi_self"
+        )
+        exec(compile("\n".join(lines), f"<invariant {class_name}>", "exec"), namespace)
+        return namespace["_vi_check"]
+    
+    def wrap_method(
+        method: Callable[..., Any],
+        check_invariants: Callable[[Any], None],
+    ) -> Callable[..., Any]:
         """Wrap a method to check invariants after execution."""
-        if asyncio.iscoroutinefunction(method):
+        if inspect.iscoroutinefunction(method):
             @functools.wraps(method)
             async def async_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
                 result = await method(self, *args, **kwargs)
-                check_invariants(self, class_name)
+                check_invariants(self)
                 return result
             return async_wrapper
         else:
             @functools.wraps(method)
             def sync_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
                 result = method(self, *args, **kwargs)
-                check_invariants(self, class_name)
+                check_invariants(self)
                 return result
             return sync_wrapper
     
     def decorator(cls: type) -> type:
+        if not _CONTRACTS_ENABLED or not parsed_conditions:
+            return cls
         class_name = cls.__qualname__
+        check_invariants = compile_check(class_name)
         
         # Wrap __init__
         original_init = cls.__init__
@@ -316,24 +675,52 @@ def invariant(
         @functools.wraps(original_init)
         def new_init(self: Any, *args: Any, **kwargs: Any) -> None:
             original_init(self, *args, **kwargs)
-            check_invariants(self, class_name)
+            check_invariants(self)
         
         cls.__init__ = new_init  # type: ignore
         
-        # Wrap public methods
+        # Wrap public instance methods; static methods, nested classes and
+        # other callables have no instance to check
         for name, value in list(cls.__dict__.items()):
             if (
-                callable(value)
+                inspect.isfunction(value)
                 and not name.startswith("_")
-                and name != "__init__"
             ):
-                setattr(cls, name, wrap_method(value, class_name))
+                setattr(cls, name, wrap_method(value, check_invariants))
         
         return cls
     
     return decorator
 
 
+def _fuse_contract(
+    func: Callable[..., Any],
+    preconditions: List[Condition],
+    postconditions: List[Condition],
+) -> Optional[Callable[..., Any]]:
+    """One generated wrapper checking both groups, or None if unsupported."""
+    func_name = func.__qualname__
+    sig = inspect.signature(func)
+    names = list(sig.parameters)
+    pre = _parse_conditions(tuple(preconditions), None, reorder=False)
+    post = _parse_conditions(tuple(postconditions), None, reorder=False)
+    
+    def violate_pre(condition: Condition, msg: str, arguments: Dict[str, Any]) -> None:
+        raise ContractViolation.precondition(condition.name, msg, func_name, arguments)
+    
+    def violate_post(condition: Condition, msg: str, result: Any) -> None:
+        raise ContractViolation.postcondition(condition.name, msg, func_name, result)
+    
+    return _compile_contract_wrapper(
+        func,
+        sig,
+        [(c, c.call_mode(names)) for c in pre],
+        _postcondition_checks(post, names),
+        violate_pre,
+        violate_post,
+    )
+
+
 class Contract:
     """
     Builder for creating complex contracts.
@@ -382,6 +769,15 @@ class Contract:
         postconditions = self._postconditions
         
         def decorator(func: F) -> F:
+            if not _CONTRACTS_ENABLED:
+                return func
+            
+            # Fuse both condition groups around a single call when possible
+            if preconditions and postconditions:
+                fused = _fuse_contract(func, preconditions, postconditions)
+                if fused is not None:
+                    return fused  # type: ignore
+            
             wrapped = func
             
             if postconditions:
@@ -434,28 +830,76 @@ def captures(*names: str) -> Callable[[F], F]:
     """
     Decorator that captures specified values before function execution.
     
-    The captured values are available in postconditions via an 'old' parameter.
+    The captured values are available in postconditions via an 'old' parameter,
+    for the duration of the call (concurrent and nested calls each see their own).
     
     Example:
         @captures("balance")
-        @ensures(lambda result, old: self.balance == old.balance - result)
+        @ensures(lambda result, self, amount, old: self.balance == old.balance - amount)
         def withdraw(self, amount: float) -> float:
             self.balance -= amount
             return amount
     """
     def decorator(func: F) -> F:
+        if not _CONTRACTS_ENABLED:
+            return func
+        
+        # Captured names become slots of a per-function OldValue subclass,
+        # unless they cannot be plain slot names
+        slotted = all(
+            name.isidentifier() and not name.startswith("__") and name != "_values"
+            for name in names
+        )
+        snapshot_cls = (
+            type(
+                f"OldValue_{func.__name__}",
+                (OldValue,),
+                {"__slots__": tuple(dict.fromkeys(names))},
+            )
+            if slotted
+            else None
+        )
+        
+        # One C-level call fetches every captured attribute
+        getter = operator.attrgetter(*names) if names else None
+        
+        def capture(instance: Any) -> tuple:
+            if getter is None:
+                return ()
+            try:
+                values = getter(instance)
+            except AttributeError:
+                # Some attribute is missing; those read back as None
+                return tuple(getattr(instance, name, None) for name in names)
+            return values if len(names) > 1 else (values,)
+        
+        def snapshot(instance: Any) -> OldValue:
+            values = capture(instance)
+            if snapshot_cls is None:
+                return OldValue(**dict(zip(names, values, strict=True)))
+            old = snapshot_cls()
+            for name, value in zip(names, values, strict=True):
+                setattr(old, name, value)
+            return old
+        
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+                token = _OLD_VALUES.set(snapshot(self))
+                try:
+                    return await func(self, *args, **kwargs)
+                finally:
+                    _OLD_VALUES.reset(token)
+            return async_wrapper  # type: ignore
+        
         @functools.wraps(func)
         def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
-            # Capture old values
-            captured = {}
-            for name in names:
-                if hasattr(self, name):
-                    captured[name] = getattr(self, name)
-            
-            # Store for postcondition access
-            wrapper._old_values = OldValue(**captured)  # type: ignore
-            
-            return func(self, *args, **kwargs)
+            # Visible to postconditions for this call only
+            token = _OLD_VALUES.set(snapshot(self))
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                _OLD_VALUES.reset(token)
         
         return wrapper  # type: ignore
     
@@ -5,12 +5,14 @@ from __future__ import annotations
 import asyncio
 import functools
 import inspect
+import weakref
 from typing import (
     Any,
     Callable,
     Dict,
     Generic,
     List,
+    NamedTuple,
     Optional,
     Type,
     TypeVar,
@@ -34,9 +36,102 @@ F = TypeVar("F", bound=Callable[..., Any])
 T = TypeVar("T")
 
 
+# Per-function caches. Weak keys let functions decorated inside factories
+# (and their closures and globals) be collected.
+_SIGNATURES: weakref.WeakKeyDictionary[
+    Callable[..., Any], tuple[inspect.Signature, tuple[tuple[str, Any], ...]]
+] = weakref.WeakKeyDictionary()
+_TYPE_HINTS: weakref.WeakKeyDictionary[Callable[..., Any], Dict[str, Any]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _signature_info(
+    func: Callable[..., Any],
+) -> tuple[inspect.Signature, tuple[tuple[str, Any], ...]]:
+    """Signature of func plus its (name, kind) parameter pairs.
+    
+    Raises TypeError for callables that cannot be weakly referenced.
+    """
+    info = _SIGNATURES.get(func)
+    if info is None:
+        sig = inspect.signature(func)
+        info = sig, tuple((name, param.kind) for name, param in sig.parameters.items())
+        _SIGNATURES[func] = info
+    return info
+
+
+def _cached_type_hints(func: Callable[..., Any]) -> Dict[str, Any]:
+    hints = _TYPE_HINTS.get(func)
+    if hints is None:
+        hints = _TYPE_HINTS[func] = get_type_hints(func)
+    return hints
+
+
+def _resolve_type_hints(func: Callable[..., Any]) -> Optional[Dict[str, Any]]:
+    """Resolved type hints of func, or None if they cannot be resolved yet.
+    
+    Failures are not cached, so forward references defined later still
+    resolve on a subsequent call.
+    """
+    try:
+        return _cached_type_hints(func)
+    except TypeError:
+        # Callables that cannot be weakly referenced are not cached
+        try:
+            return get_type_hints(func)
+        except Exception:
+            return None
+    except Exception:
+        return None
+
+
+def _type_hints(func: Callable[..., Any]) -> Dict[str, Any]:
+    """Resolved type hints of func, or {} if they cannot be resolved."""
+    hints = _resolve_type_hints(func)
+    return hints if hints is not None else {}
+
+
+def _function_signature(
+    func: Callable[..., Any],
+) -> tuple[inspect.Signature, tuple[tuple[str, Any], ...]]:
+    try:
+        return _signature_info(func)
+    except TypeError:
+        # Not weakly referenceable, so not cached
+        sig = inspect.signature(func)
+        return sig, tuple((name, p.kind) for name, p in sig.parameters.items())
+
+
+# validate_return() default meaning "look the return type up"
+_UNRESOLVED: Any = object()
+
+# Parameter kinds as stored in ParameterPlan steps
+_POSITIONAL, _VAR_POSITIONAL, _VAR_KEYWORD, _KEYWORD = range(4)
+_KIND_CODES = {
+    inspect.Parameter.POSITIONAL_ONLY: _POSITIONAL,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD: _POSITIONAL,
+    inspect.Parameter.VAR_POSITIONAL: _VAR_POSITIONAL,
+    inspect.Parameter.VAR_KEYWORD: _VAR_KEYWORD,
+    inspect.Parameter.KEYWORD_ONLY: _KEYWORD,
+}
+
+
+class ParameterPlan(NamedTuple):
+    """What to check for each parameter of one function, in signature order."""
+    
+    signature: inspect.Signature
+    # (name, expected type or None, custom validator or None, kind code)
+    steps: tuple[tuple[str, Any, Optional[BaseValidator[Any]], Any], ...]
+    # Every parameter can be passed positionally (no *args/**kwargs/kw-only)
+    all_positional: bool
+
+
 class ParameterValidator:
     """Validates function parameters based on type hints and custom validators."""
 
+    __slots__ = ("validators", "validate_types", "coerce_types", "strict", "raise_on_error")
+
     def __init__(
         self,
         validators: Optional[Dict[str, BaseValidator[Any]]] = None,
@@ -51,110 +146,257 @@ class ParameterValidator:
         self.strict = strict
         self.raise_on_error = raise_on_error
     
+    def build_plan(self, func: Callable[..., Any]) -> Optional[ParameterPlan]:
+        """Precompute the per-parameter checks for func.
+        
+        Returns None while func's type hints cannot be resolved (e.g. a
+        forward reference not defined yet), so callers can retry later.
+        """
+        hints: Optional[Dict[str, Any]] = {}
+        if self.validate_types:
+            hints = _resolve_type_hints(func)
+            if hints is None:
+                return None
+        return self._plan(func, hints)
+    
+    def _plan(self, func: Callable[..., Any], hints: Dict[str, Any]) -> ParameterPlan:
+        sig, parameters = _function_signature(func)
+        validators = self.validators
+        return ParameterPlan(
+            sig,
+            tuple(
+                (name, hints.get(name), validators.get(name), _KIND_CODES[kind])
+                for name, kind in parameters
+            ),
+            all(_KIND_CODES[kind] == _POSITIONAL for _, kind in parameters),
+        )
+    
+    def check_argument(
+        self,
+        param_name: str,
+        param_value: Any,
+        expected_type: Any,
+        validator: Optional[BaseValidator[Any]],
+        context: ValidationContext,
+        report: Callable[[ValidationError], Any],
+    ) -> Any:
+        """Validate one argument, passing each error to report.
+        
+        Returns the (possibly coerced) value.
+        """
+        if expected_type is None and validator is None:
+            return param_value
+        param_ctx = context.child(param_name)
+        validated_value = param_value
+        
+        # Type validation
+        if expected_type is not None:
+            type_result = validate_type(
+                param_value,
+                expected_type,
+                coerce=self.coerce_types,
+                strict=self.strict,
+                context=param_ctx,
+            )
+            
+            if not type_result.is_valid:
+                for issue in type_result.issues:
+                    report(
+                        ValidationError(
+                            issue.message,
+                            code=issue.code or "type_error",
+                            field=param_name,
+                            path=issue.path,
+                            value=param_value,
+                        )
+                    )
+            elif type_result.value is not None:
+                validated_value = type_result.value
+        
+        # Custom validator
+        if validator is not None:
+            result = validator.validate(validated_value, param_ctx)
+            
+            if not result.is_valid:
+                for issue in result.issues:
+                    report(
+                        ValidationError(
+                            issue.message,
+                            code=issue.code or "validation_error",
+                            field=param_name,
+                            path=issue.path,
+                            value=validated_value,
+                        )
+                    )
+            elif result.value is not None:
+                validated_value = result.value
+        
+        return validated_value
+    
     def validate_arguments(
         self,
         func: Callable[..., Any],
         args: tuple,
         kwargs: Dict[str, Any],
+        plan: Optional[ParameterPlan] = None,
     ) -> tuple[tuple, Dict[str, Any], ValidationErrorCollection]:
-        """Validate function arguments and return validated/coerced values."""
-        sig = inspect.signature(func)
+        """Validate function arguments and return validated/coerced values.
         
-        try:
-            type_hints = get_type_hints(func)
-        except Exception:
-            type_hints = {}
+        Pass a plan from build_plan() to skip per-call signature and type
+        hint lookups.
         
-        # Bind arguments to parameters
-        try:
-            bound = sig.bind(*args, **kwargs)
-            bound.apply_defaults()
-        except TypeError as e:
-            errors = ValidationErrorCollection()
-            errors.add(ValidationError(str(e), code="argument_error"))
-            return args, kwargs, errors
+        Raises:
+            TypeError: If the arguments do not fit func's signature, as when
+                calling func directly. Every validating wrapper behaves this
+                way, whether or not it binds the arguments itself.
+        """
+        if plan is None:
+            plan = self._plan(func, _type_hints(func) if self.validate_types else {})
+        steps = plan.steps
+        
+        # One positional argument per parameter maps straight onto the steps
+        positional_call = plan.all_positional and not kwargs and len(args) == len(steps)
+        if positional_call:
+            values: Any = args
+        else:
+            # Bind arguments to parameters
+            try:
+                bound = plan.signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+            except TypeError as e:
+                raise TypeError(f"{func.__qualname__}() {e}") from None
+            # apply_defaults() fills every parameter, so arguments line up with steps
+            values = bound.arguments.values()
         
         errors = ValidationErrorCollection()
-        validated_args: Dict[str, Any] = {}
+        # One value per step, in signature order
+        validated_values: List[Any] = []
         context = ValidationContext()
+        changed = False
         
-        for param_name, param_value in bound.arguments.items():
-            param_ctx = context.child(param_name)
-            validated_value = param_value
-            
-            # Type validation
-            if self.validate_types and param_name in type_hints:
-                expected_type = type_hints[param_name]
-                type_result = validate_type(
-                    param_value,
-                    expected_type,
-                    coerce=self.coerce_types,
-                    strict=self.strict,
-                    context=param_ctx,
-                )
-                
-                if not type_result.is_valid:
-                    for issue in type_result.issues:
-                        errors.add(
-                            ValidationError(
-                                issue.message,
-                                code=issue.code or "type_error",
-                                field=param_name,
-                                path=issue.path,
-                                value=param_value,
-                            )
-                        )
-                elif type_result.value is not None:
-                    validated_value = type_result.value
-            
-            # Custom validator
-            if param_name in self.validators:
-                validator = self.validators[param_name]
-                result = validator.validate(validated_value, param_ctx)
-                
-                if not result.is_valid:
-                    for issue in result.issues:
-                        errors.add(
-                            ValidationError(
-                                issue.message,
-                                code=issue.code or "validation_error",
-                                field=param_name,
-                                path=issue.path,
-                                value=validated_value,
-                            )
-                        )
-                elif result.value is not None:
-                    validated_value = result.value
-            
-            validated_args[param_name] = validated_value
+        for (param_name, expected_type, validator, _), param_value in zip(
+            steps, values, strict=True
+        ):
+            if expected_type is None and validator is None:
+                # Nothing to check, so no child context either
+                validated_values.append(param_value)
+                continue
+            validated_value = self.check_argument(
+                param_name, param_value, expected_type, validator, context, errors.add
+            )
+            validated_values.append(validated_value)
+            if validated_value is not param_value:
+                changed = True
+        
+        # Nothing was coerced: the caller's arguments can be passed on as-is
+        if not changed:
+            return args, kwargs, errors
+        
+        if positional_call:
+            return tuple(validated_values), {}, errors
         
         # Convert back to args and kwargs
         new_args: List[Any] = []
         new_kwargs: Dict[str, Any] = {}
         
-        for param_name, param in sig.parameters.items():
-            if param_name in validated_args:
-                if param.kind in (
-                    inspect.Parameter.POSITIONAL_ONLY,
-                    inspect.Parameter.POSITIONAL_OR_KEYWORD,
-                ):
-                    if len(new_args) < len(args):
-                        new_args.append(validated_args[param_name])
-                    else:
-                        new_kwargs[param_name] = validated_args[param_name]
-                elif param.kind == inspect.Parameter.VAR_POSITIONAL:
-                    new_args.extend(validated_args[param_name])
-                elif param.kind == inspect.Parameter.VAR_KEYWORD:
-                    new_kwargs.update(validated_args[param_name])
+        for (param_name, _, _, kind), validated_value in zip(steps, validated_values, strict=True):
+            if kind == _POSITIONAL:
+                if len(new_args) < len(args):
+                    new_args.append(validated_value)
                 else:
-                    new_kwargs[param_name] = validated_args[param_name]
+                    new_kwargs[param_name] = validated_value
+            elif kind == _VAR_POSITIONAL:
+                new_args.extend(validated_value)
+            elif kind == _VAR_KEYWORD:
+                new_kwargs.update(validated_value)
+            else:
+                new_kwargs[param_name] = validated_value
         
         return tuple(new_args), new_kwargs, errors
 
 
+def _compile_validated_wrapper(
+    func: Callable[..., Any],
+    plan: ParameterPlan,
+    param_validator: ParameterValidator,
+    raise_on_error: bool,
+    is_async: bool,
+    return_validator: Optional[ReturnValidator] = None,
+    return_type: Any = _UNRESOLVED,
+) -> Optional[Callable[..., Any]]:
+    """Generate a wrapper taking func's exact parameters, or None if unsupported.
+    
+    Only parameters with a type hint or validator are checked, and func is
+    called directly, with no signature binding; the result then goes
+    through return_validator, if given. Functions with *args or **kwargs
+    use the generic wrappers.
+    """
+    namespace: Dict[str, Any] = {
+        "_vi_func": func,
+        "_vi_check": param_validator.check_argument,
+        "_vi_context": ValidationContext,
+        "_vi_collection": ValidationErrorCollection,
+        "_vi_check_return": return_validator.validate_return if return_validator else None,
+        "_vi_return_type": return_type,
+    }
+    signature: List[str] = []
+    call: List[str] = []
+    checks: List[str] = []
+    previous_kind = None
+    for i, (name, expected, validator, _) in enumerate(plan.steps):
+        param = plan.signature.parameters[name]
+        kind = param.kind
+        if kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD) or name.startswith("_vi_"):
+            return None
+        if previous_kind is param.POSITIONAL_ONLY and kind is not param.POSITIONAL_ONLY:
+            signature.append("/")
+        if kind is param.KEYWORD_ONLY and previous_kind is not param.KEYWORD_ONLY:
+            signature.append("*")
+        previous_kind = kind
+        
+        if param.default is param.empty:
+            signature.append(name)
+        else:
+            namespace[f"_vi_d{i}"] = param.default
+            signature.append(f"{name}=_vi_d{i}")
+        call.append(f"{name}={name}" if kind is param.KEYWORD_ONLY else name)
+        if expected is not None or validator is not None:
+            namespace[f"_vi_t{i}"] = expected
+            namespace[f"_vi_v{i}"] = validator
+            checks.append(
+                f"    {name} = _vi_check({name!r}, {name}, _vi_t{i}, _vi_v{i}, "
+                "_vi_ctx, _vi_errors.append)"
+            )
+    if previous_kind is inspect.Parameter.POSITIONAL_ONLY:
+        signature.append("/")
+    
+    lines = [
+        f"{'async ' if is_async else ''}def _vi_wrapper({', '.join(signature)}):",
+        "    _vi_ctx = _vi_context()",
+        "    _vi_errors = []",
+        *checks,
+    ]
+    if raise_on_error:
+        lines += ["    if _vi_errors:", "        raise _vi_collection(_vi_errors)"]
+    lines.append(f"    _vi_result = {'await ' if is_async else ''}_vi_func({', '.join(call)})")
+    if return_validator is not None:
+        lines.append(
+            "    _vi_result, _vi_return_errors = "
+            "_vi_check_return(_vi_func, _vi_result, _vi_return_type)"
+        )
+        if raise_on_error:
+            lines += ["    if _vi_return_errors:", "        raise _vi_return_errors"]
+    lines.append("    return _vi_result")
+    
+    exec(compile("\n".join(lines), f"<validated {func.__qualname__}>", "exec"), namespace)
+    return functools.wraps(func)(namespace["_vi_wrapper"])
+
+
 class ReturnValidator:
     """Validates function return values."""
 
+    __slots__ = ("validator", "validate_type", "coerce_type", "strict")
+
     def __init__(
         self,
         validator: Optional[BaseValidator[Any]] = None,
@@ -171,24 +413,23 @@ class ReturnValidator:
         self,
         func: Callable[..., Any],
         value: Any,
+        return_type: Any = _UNRESOLVED,
     ) -> tuple[Any, ValidationErrorCollection]:
-        """Validate return value."""
+        """Validate return value.
+        
+        Pass return_type (None for unannotated) to skip the type hint lookup.
+        """
         errors = ValidationErrorCollection()
+        report = errors.add
         validated_value = value
         context = ValidationContext()
         
-        try:
-            type_hints = get_type_hints(func)
-        except Exception:
-            type_hints = {}
-        
-        return_type = type_hints.get("return")
+        if return_type is _UNRESOLVED:
+            return_type = _type_hints(func).get("return")
         
         # Type validation
         if self.validate_type and return_type is not None:
-            from validation_infrastructure.core.types import validate_type as vt
-            
-            type_result = vt(
+            type_result = validate_type(
                 value,
                 return_type,
                 coerce=self.coerce_type,
@@ -198,7 +439,7 @@ class ReturnValidator:
             
             if not type_result.is_valid:
                 for issue in type_result.issues:
-                    errors.add(
+                    report(
                         ValidationError(
                             issue.message,
                             code=issue.code or "return_type_error",
@@ -215,7 +456,7 @@ class ReturnValidator:
             
             if not result.is_valid:
                 for issue in result.issues:
-                    errors.add(
+                    report(
                         ValidationError(
                             issue.message,
                             code=issue.code or "return_validation_error",
@@ -229,6 +470,84 @@ class ReturnValidator:
         return validated_value, errors
 
 
+def _wrap_validated(
+    func: F,
+    param_validator: Optional[ParameterValidator],
+    return_validator: Optional[ReturnValidator],
+    raise_on_error: bool,
+) -> F:
+    """Wrap func in a single wrapper running the given validators.
+    
+    Checks that turn out to have nothing to do are dropped at decoration
+    time, and func is returned unwrapped if none are left.
+    """
+    plan = None
+    if param_validator is not None:
+        # Built once here; None falls back to per-call lookups until the
+        # type hints resolve
+        plan = param_validator.build_plan(func)
+        if plan is not None and all(
+            expected is None and validator is None for _, expected, validator, _ in plan.steps
+        ):
+            param_validator = None
+    
+    return_type = _UNRESOLVED
+    if return_validator is not None:
+        hints = _resolve_type_hints(func)
+        if hints is not None:
+            return_type = hints.get("return")
+        if return_validator.validator is None and (
+            not return_validator.validate_type or return_type is None
+        ):
+            return_validator = None
+    
+    if param_validator is None and return_validator is None:
+        # Nothing to check: leave func unwrapped
+        return func
+    is_async = asyncio.iscoroutinefunction(func)
+    if param_validator is not None and plan is not None:
+        compiled = _compile_validated_wrapper(
+            func, plan, param_validator, raise_on_error, is_async, return_validator, return_type
+        )
+        if compiled is not None:
+            return compiled  # type: ignore
+    
+    if is_async:
+        @functools.wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            if param_validator is not None:
+                args, kwargs, errors = param_validator.validate_arguments(
+                    func, args, kwargs, plan
+                )
+                if raise_on_error and errors:
+                    raise errors
+            result = await func(*args, **kwargs)
+            if return_validator is not None:
+                result, errors = return_validator.validate_return(func, result, return_type)
+                if raise_on_error and errors:
+                    raise errors
+            return result
+        
+        return async_wrapper  # type: ignore
+    else:
+        @functools.wraps(func)
+        def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+            if param_validator is not None:
+                args, kwargs, errors = param_validator.validate_arguments(
+                    func, args, kwargs, plan
+                )
+                if raise_on_error and errors:
+                    raise errors
+            result = func(*args, **kwargs)
+            if return_validator is not None:
+                result, errors = return_validator.validate_return(func, result, return_type)
+                if raise_on_error and errors:
+                    raise errors
+            return result
+        
+        return sync_wrapper  # type: ignore
+
+
 def validate_params(
     validators: Optional[Dict[str, BaseValidator[Any]]] = None,
     *,
@@ -264,28 +583,7 @@ def validate_params(
     )
     
     def decorator(func: F) -> F:
-        if asyncio.iscoroutinefunction(func):
-            @functools.wraps(func)
-            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-                new_args, new_kwargs, errors = param_validator.validate_arguments(
-                    func, args, kwargs
-                )
-                if errors and raise_on_error:
-                    raise errors
-                return await func(*new_args, **new_kwargs)
-            
-            return async_wrapper  # type: ignore
-        else:
-            @functools.wraps(func)
-            def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-                new_args, new_kwargs, errors = param_validator.validate_arguments(
-                    func, args, kwargs
-                )
-                if errors and raise_on_error:
-                    raise errors
-                return func(*new_args, **new_kwargs)
-            
-            return sync_wrapper  # type: ignore
+        return _wrap_validated(func, param_validator, None, raise_on_error)
     
     return decorator
 
@@ -321,26 +619,7 @@ def validate_return(
     )
     
     def decorator(func: F) -> F:
-        if asyncio.iscoroutinefunction(func):
-            @functools.wraps(func)
-            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-                result = await func(*args, **kwargs)
-                validated_result, errors = return_validator.validate_return(func, result)
-                if errors and raise_on_error:
-                    raise errors
-                return validated_result
-            
-            return async_wrapper  # type: ignore
-        else:
-            @functools.wraps(func)
-            def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-                result = func(*args, **kwargs)
-                validated_result, errors = return_validator.validate_return(func, result)
-                if errors and raise_on_error:
-                    raise errors
-                return validated_result
-            
-            return sync_wrapper  # type: ignore
+        return _wrap_validated(func, None, return_validator, raise_on_error)
     
     return decorator
 
@@ -365,28 +644,24 @@ def validated(
         def create_user(email: str, name: str) -> User:
             ...
     """
+    param_validator = ParameterValidator(
+        validators=param_validators,
+        validate_types=validate_types,
+        coerce_types=coerce_types,
+        strict=strict,
+        raise_on_error=raise_on_error,
+    )
+    result_validator = ReturnValidator(
+        validator=return_validator,
+        validate_type=validate_types,
+        coerce_type=coerce_types,
+        strict=strict,
+    )
+    
     def decorator(func: F) -> F:
-        # Apply return validation first (inner), then param validation (outer)
-        wrapped = func
-        
-        if return_validator is not None or validate_types:
-            wrapped = validate_return(
-                return_validator,
-                validate_type=validate_types,
-                coerce_type=coerce_types,
-                strict=strict,
-                raise_on_error=raise_on_error,
-            )(wrapped)
-        
-        wrapped = validate_params(
-            param_validators,
-            validate_types=validate_types,
-            coerce_types=coerce_types,
-            strict=strict,
-            raise_on_error=raise_on_error,
-        )(wrapped)
-        
-        return wrapped  # type: ignore
+        # Parameters are checked before the call and the result after it,
+        # within one wrapper
+        return _wrap_validated(func, param_validator, result_validator, raise_on_error)
     
     return decorator
 
@@ -411,14 +686,21 @@ class ValidatorDecorator:
         field: Optional[str] = None,
         mode: str = "after",
         check_fields: bool = True,
+        fields: tuple[str, ...] = (),
+        is_model_validator: bool = False,
     ):
         self.field = field
         self.mode = mode  # "before", "after", "wrap"
         self.check_fields = check_fields
+        self._fields = fields
+        self._is_model_validator = is_model_validator
         self._func: Optional[Callable[..., Any]] = None
+        self._arity = 0
     
     def __call__(self, func: Callable[..., Any]) -> ValidatorDecorator:
         self._func = func
+        # Parameter count decides how validate() calls func
+        self._arity = len(_function_signature(func)[0].parameters)
         functools.update_wrapper(self, func)
         return self
     
@@ -427,16 +709,10 @@ class ValidatorDecorator:
         if self._func is None:
             raise RuntimeError("Validator function not set")
         
-        sig = inspect.signature(self._func)
-        params = list(sig.parameters.keys())
-        
         # Determine how to call the function
-        if len(params) == 1:
-            return self._func(value)
-        elif len(params) == 2:
+        if self._arity == 2:
             return self._func(value, info or {})
-        else:
-            return self._func(value)
+        return self._func(value)
 
 
 def validator(
@@ -482,9 +758,7 @@ def field_validator(
                 return v.lower()
     """
     def decorator(func: Callable[..., Any]) -> ValidatorDecorator:
-        v = ValidatorDecorator(mode=mode, check_fields=check_fields)(func)
-        v._fields = fields
-        return v
+        return ValidatorDecorator(mode=mode, check_fields=check_fields, fields=fields)(func)
     
     return decorator
 
@@ -505,15 +779,19 @@ def model_validator(
                 return values
     """
     def decorator(func: Callable[..., Any]) -> ValidatorDecorator:
-        v = ValidatorDecorator(mode=mode)(func)
-        v._is_model_validator = True
-        return v
+        return ValidatorDecorator(mode=mode, is_model_validator=True)(func)
     
     return decorator
 
 
-class ValidationContext:
-    """Context object passed to validators with field information."""
+class FieldValidationContext:
+    """Context object passed to validators with field information.
+    
+    Distinct from ``core.base.ValidationContext``, which the parameter
+    validators above use for error paths.
+    """
+    
+    __slots__ = ("field_name", "data", "config")
     
     def __init__(
         self,
@@ -0,0 +1,159 @@
+"""Numba-compiled kernels for DSP effect validation.
+
+Imported lazily by ``EffectValidator(jit=True)``; importing this module
+requires numba and numpy.
+"""
+
+from __future__ import annotations
+
+import numba
+import numpy as np
+
+# Fields of a partial result from _jit_chunk_stats
+_MEAN_C, _MEAN_R, _M2_C, _M2_R, _CO_M = 0, 1, 2, 3, 4
+_SUM_ABS_E, _SUM_E2, _SUM_R2, _MAX_ABS_E, _MAX_ABS_R = 5, 6, 7, 8, 9
+_N_FIELDS = 10
+
+
+@numba.njit(cache=True)
+def _jit_chunk_stats(cpp: np.ndarray, ref: np.ndarray, start: int, stop: int) -> np.ndarray:
+    """Partial statistics of cpp[start:stop] against ref[start:stop].
+
+    Means, variances and the covariance use Welford's updates, so constant
+    signals give exactly zero variance. NaNs propagate into the maxima as
+    they do with ``np.max``.
+    """
+    out = np.zeros(_N_FIELDS)
+    mean_c = 0.0
+    mean_r = 0.0
+    m2_c = 0.0
+    m2_r = 0.0
+    co_m = 0.0
+    sum_abs_e = 0.0
+    sum_e2 = 0.0
+    sum_r2 = 0.0
+    max_abs_e = 0.0
+    max_abs_r = 0.0
+    for i in range(start, stop):
+        c = np.float64(cpp[i])
+        r = np.float64(ref[i])
+
+        k = i - start + 1
+        dc = c - mean_c
+        mean_c += dc / k
+        dr = r - mean_r
+        mean_r += dr / k
+        m2_c += dc * (c - mean_c)
+        m2_r += dr * (r - mean_r)
+        co_m += dc * (r - mean_r)
+
+        e = c - r
+        abs_e = abs(e)
+        sum_abs_e += abs_e
+        sum_e2 += e * e
+        sum_r2 += r * r
+        if abs_e > max_abs_e or abs_e != abs_e:
+            max_abs_e = abs_e
+        abs_r = abs(r)
+        if abs_r > max_abs_r or abs_r != abs_r:
+            max_abs_r = abs_r
+
+    out[_MEAN_C] = mean_c
+    out[_MEAN_R] = mean_r
+    out[_M2_C] = m2_c
+    out[_M2_R] = m2_r
+    out[_CO_M] = co_m
+    out[_SUM_ABS_E] = sum_abs_e
+    out[_SUM_E2] = sum_e2
+    out[_SUM_R2] = sum_r2
+    out[_MAX_ABS_E] = max_abs_e
+    out[_MAX_ABS_R] = max_abs_r
+    return out
+
+
+@numba.njit(cache=True)
+def _jit_finish_stats(
+    n: int,
+    stats: np.ndarray,
+) -> tuple[float, float, float, float, float, float, float, float]:
+    """Turn the partial statistics of all n samples into final values."""
+    m2_c = stats[_M2_C]
+    m2_r = stats[_M2_R]
+    correlation = 0.0
+    if m2_c > 0.0 and m2_r > 0.0:
+        correlation = min(1.0, max(-1.0, stats[_CO_M] / np.sqrt(m2_c * m2_r)))
+    return (
+        stats[_MAX_ABS_E],
+        stats[_SUM_ABS_E] / n,
+        np.sqrt(m2_c / n),
+        np.sqrt(m2_r / n),
+        correlation,
+        stats[_SUM_R2] / n,
+        stats[_SUM_E2] / n,
+        stats[_MAX_ABS_R],
+    )
+
+
+@numba.njit(cache=True)
+def _jit_effect_stats(
+    cpp: np.ndarray,
+    ref: np.ndarray,
+) -> tuple[float, float, float, float, float, float, float, float]:
+    """Compare two equal-length, non-empty signals in a single pass.
+
+    Returns:
+        (max |cpp - ref|, mean |cpp - ref|, std(cpp), std(ref),
+        correlation (0.0 if either std is zero), mean(ref**2),
+        mean((cpp - ref)**2), max |ref|)
+    """
+    n = cpp.shape[0]
+    return _jit_finish_stats(n, _jit_chunk_stats(cpp, ref, 0, n))
+
+
+@numba.njit(cache=True, parallel=True)
+def _jit_effect_stats_parallel(
+    cpp: np.ndarray,
+    ref: np.ndarray,
+    n_chunks: int,
+) -> tuple[float, float, float, float, float, float, float, float]:
+    """``_jit_effect_stats`` over n_chunks chunks of the signals in parallel.
+
+    Chunk results are merged with Chan et al.'s pairwise update for the
+    means and (co)variances. The caller picks n_chunks (at most the number
+    of samples, usually one per thread): calling ``numba.get_num_threads()``
+    in here would make the function uncacheable, so every process would
+    compile it again.
+    """
+    n = cpp.shape[0]
+    partial = np.empty((n_chunks, _N_FIELDS))
+    for t in numba.prange(n_chunks):
+        partial[t] = _jit_chunk_stats(cpp, ref, t * n // n_chunks, (t + 1) * n // n_chunks)
+
+    stats = partial[0].copy()
+    count = n // n_chunks
+    for t in range(1, n_chunks):
+        part = partial[t]
+        part_count = (t + 1) * n // n_chunks - t * n // n_chunks
+        total = count + part_count
+        weight = count * part_count / total
+        dc = part[_MEAN_C] - stats[_MEAN_C]
+        dr = part[_MEAN_R] - stats[_MEAN_R]
+        stats[_MEAN_C] += dc * part_count / total
+        stats[_MEAN_R] += dr * part_count / total
+        stats[_M2_C] += part[_M2_C] + dc * dc * weight
+        stats[_M2_R] += part[_M2_R] + dr * dr * weight
+        stats[_CO_M] += part[_CO_M] + dc * dr * weight
+        stats[_SUM_ABS_E] += part[_SUM_ABS_E]
+        stats[_SUM_E2] += part[_SUM_E2]
+        stats[_SUM_R2] += part[_SUM_R2]
+        # A NaN maximum wins and then sticks, as with np.max
+        if stats[_MAX_ABS_E] == stats[_MAX_ABS_E] and (
+            part[_MAX_ABS_E] > stats[_MAX_ABS_E] or part[_MAX_ABS_E] != part[_MAX_ABS_E]
+        ):
+            stats[_MAX_ABS_E] = part[_MAX_ABS_E]
+        if stats[_MAX_ABS_R] == stats[_MAX_ABS_R] and (
+            part[_MAX_ABS_R] > stats[_MAX_ABS_R] or part[_MAX_ABS_R] != part[_MAX_ABS_R]
+        ):
+            stats[_MAX_ABS_R] = part[_MAX_ABS_R]
+        count = total
+    return _jit_finish_stats(n, stats)
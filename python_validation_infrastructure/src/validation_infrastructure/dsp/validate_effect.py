@@ -6,22 +6,231 @@ using tiered tolerance thresholds.
 
 from __future__ import annotations
 
-import argparse
+import functools
 import json
+import math
 import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import numpy as np
+from numpy.typing import DTypeLike
 
-try:
-    from rich.console import Console
-    from rich.table import Table
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
+# With jit=True, signals at least this long are reduced on all threads
+# (about 1.5 s at 44.1 kHz)
+PARALLEL_MIN_SAMPLES = 1 << 16
+
+
+@functools.cache
+def _jit_kernels() -> tuple[Callable[..., Any], Callable[..., Any]] | None:
+    """Import the Numba kernels on first use; None when numba is missing.
+    
+    Importing numba costs a few hundred milliseconds, so only validators
+    created with ``jit=True`` pay for it.
+    """
+    try:
+        import numba
+
+        from validation_infrastructure.dsp._jit import (
+            _jit_effect_stats,
+            _jit_effect_stats_parallel,
+        )
+    except ImportError:
+        return None
+    
+    def effect_stats_parallel(cpp: np.ndarray, ref: np.ndarray) -> Any:
+        return _jit_effect_stats_parallel(cpp, ref, min(numba.get_num_threads(), len(cpp)))
+    
+    return _jit_effect_stats, effect_stats_parallel
+
+
+def _effect_stats(
+    cpp: np.ndarray,
+    ref: np.ndarray,
+    jit: bool = False,
+) -> tuple[float, float, float, float, float, float, float, float]:
+    """Comparison statistics of cpp against ref.
+    
+    Uses NumPy, or with ``jit`` the single-pass Numba kernel (multi-threaded
+    from PARALLEL_MIN_SAMPLES samples). See ``_jit_effect_stats`` for the
+    returned tuple.
+    """
+    kernels = _jit_kernels() if jit and len(cpp) else None
+    if kernels is not None:
+        effect_stats, effect_stats_parallel = kernels
+        if len(cpp) >= PARALLEL_MIN_SAMPLES:
+            return effect_stats_parallel(cpp, ref)
+        return effect_stats(cpp, ref)
+    
+    error = cpp - ref
+    abs_error = np.abs(error)
+    max_error = np.max(abs_error)
+    
+    # Pearson correlation straight from the centred signals
+    n = len(cpp)
+    cpp_centred = cpp - np.mean(cpp)
+    ref_centred = ref - np.mean(ref)
+    ss_cpp = np.dot(cpp_centred, cpp_centred)
+    ss_ref = np.dot(ref_centred, ref_centred)
+    std_cpp = np.sqrt(ss_cpp / n)
+    std_ref = np.sqrt(ss_ref / n)
+    if std_cpp > 0 and std_ref > 0:
+        correlation = np.clip(
+            np.dot(cpp_centred, ref_centred) / np.sqrt(ss_cpp * ss_ref), -1.0, 1.0
+        )
+    else:
+        correlation = 0.0
+    return (
+        max_error,
+        np.mean(abs_error),
+        std_cpp,
+        std_ref,
+        correlation,
+        np.mean(ref ** 2),
+        np.mean(error ** 2),
+        np.max(np.abs(ref)),
+    )
+
+
+def _batch_effect_stats(
+    cpp: np.ndarray,
+    ref: np.ndarray,
+) -> tuple[np.ndarray, ...]:
+    """``_effect_stats`` for each row of two (effects, samples) arrays."""
+    n = cpp.shape[1]
+    error = cpp - ref
+    abs_error = np.abs(error)
+    
+    cpp_centred = cpp - cpp.mean(axis=1, keepdims=True)
+    ref_centred = ref - ref.mean(axis=1, keepdims=True)
+    ss_cpp = np.einsum("ij,ij->i", cpp_centred, cpp_centred)
+    ss_ref = np.einsum("ij,ij->i", ref_centred, ref_centred)
+    std_cpp = np.sqrt(ss_cpp / n)
+    std_ref = np.sqrt(ss_ref / n)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        correlation = np.clip(
+            np.einsum("ij,ij->i", cpp_centred, ref_centred) / np.sqrt(ss_cpp * ss_ref),
+            -1.0,
+            1.0,
+        )
+    correlation = np.where((std_cpp > 0) & (std_ref > 0), correlation, 0.0)
+    return (
+        abs_error.max(axis=1),
+        abs_error.mean(axis=1),
+        std_cpp,
+        std_ref,
+        correlation,
+        np.einsum("ij,ij->i", ref, ref) / n,
+        np.einsum("ij,ij->i", error, error) / n,
+        np.abs(ref).max(axis=1),
+    )
+
+
+# A pass is certain once max |cpp - ref| is this small relative to the
+# reference: var(error) / var(ref) below 1 - 0.99**2 keeps the correlation
+# above 0.99, and mean(ref**2) / max_error**2 above 1e4 keeps SNR above 40 dB
+_CORRELATION_MARGIN = 1 - 0.99 ** 2
+_SNR_MARGIN = 1e4
+
+
+def _certain_pass_stats(
+    cpp: np.ndarray,
+    ref: np.ndarray,
+) -> tuple[float, float, float, float, float, float, float, float] | None:
+    """Cheaper ``_effect_stats`` for outputs that certainly pass, else None.
+    
+    Only the error peak and the reference's power and variance are
+    computed; correlation, SNR and std(cpp) are replaced by lower bounds
+    derived from them.
+    """
+    error = cpp - ref
+    abs_error = np.abs(error)
+    max_error = float(np.max(abs_error))
+    signal_power = float(np.dot(ref, ref)) / len(ref)
+    ref_var = float(np.var(ref))
+    noise_bound = max_error * max_error
+    if not (
+        noise_bound < ref_var * _CORRELATION_MARGIN
+        and signal_power > noise_bound * _SNR_MARGIN
+    ):
+        return None
+    
+    std_ref = math.sqrt(ref_var)
+    return (
+        max_error,
+        np.mean(abs_error),
+        std_ref - max_error,
+        std_ref,
+        math.sqrt(1 - noise_bound / ref_var),
+        signal_power,
+        noise_bound,
+        np.max(np.abs(ref)),
+    )
+
+
+def _amplitude_db(value: float, epsilon: float) -> float:
+    """Amplitude in dB, or -100 for zero; epsilon keeps the log finite."""
+    return 20 * math.log10(value + epsilon) if value > 0 else -100
+
+
+def _read_reference(reference_path: Path, dtype: np.dtype) -> np.ndarray:
+    """Decode a reference file; see ``EffectValidator.load_reference``."""
+    suffix = reference_path.suffix.lower()
+    
+    if suffix == ".mat":
+        try:
+            from scipy.io import loadmat
+            data = loadmat(reference_path)
+            # Find the signal array (usually named 'y' or 'output')
+            for key in ["y", "output", "signal", "data"]:
+                if key in data:
+                    return np.array(data[key]).flatten().astype(dtype, copy=False)
+            # Return first non-metadata array
+            for key, value in data.items():
+                if not key.startswith("__"):
+                    return np.array(value).flatten().astype(dtype, copy=False)
+        except ImportError as err:
+            raise ImportError("scipy required for .mat file support") from err
+    
+    elif suffix == ".npy":
+        data = np.load(reference_path, mmap_mode="r")
+        if data.dtype == dtype:
+            # Mapped rather than read: pages load as the statistics touch them
+            return data
+        return data.astype(dtype)
+    
+    elif suffix == ".wav":
+        try:
+            import soundfile as sf
+            data, _ = sf.read(reference_path, dtype=dtype.name)
+            if data.ndim > 1:
+                data = data[:, 0]  # Take first channel
+            return data
+        except ImportError as err:
+            raise ImportError("soundfile required for .wav file support") from err
+    
+    elif suffix == ".csv":
+        return np.loadtxt(reference_path, delimiter=",", dtype=dtype)
+    
+    else:
+        raise ValueError(f"Unsupported reference file format: {suffix}")
+
+
+@functools.lru_cache(maxsize=64)
+def _load_reference_cached(
+    path: str,
+    mtime_ns: int,
+    size: int,
+    dtype: np.dtype,
+) -> np.ndarray:
+    """Decoded reference file, cached on (path, mtime, size) so edits reload."""
+    data = _read_reference(Path(path), dtype)
+    if data is not None:
+        # Shared between callers
+        data.flags.writeable = False
+    return data
 
 
 class ToleranceTier(Enum):
@@ -30,7 +239,7 @@ class ToleranceTier(Enum):
     RELAXED = 1.0    # ±1.0 dB for virtual analog effects
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of validating an effect against MATLAB reference."""
     effect_name: str
@@ -72,13 +281,29 @@ class EffectValidator:
         print(result)
     """
     
-    def __init__(self, verbose: bool = False) -> None:
+    def __init__(
+        self,
+        verbose: bool = False,
+        early_exit: bool = False,
+        jit: bool = False,
+    ) -> None:
         self.verbose = verbose
-        self.console = Console() if RICH_AVAILABLE else None
+        # Without jit, report clear passes from a cheaper partial pass;
+        # their correlation and SNR are then lower bounds
+        self.early_exit = early_exit
+        # Compute statistics with the Numba kernels (the ``jit`` extra). The
+        # first validation then loads or compiles them, so this only pays
+        # off for long signals or many validations per process.
+        self.jit = jit
+        if jit and _jit_kernels() is None:
+            raise ImportError("numba is required for EffectValidator(jit=True)")
+        # Rich console, created on first verbose print
+        self.console: Any = None
     
     def load_reference(
         self,
         reference_path: Path,
+        dtype: DTypeLike = np.float32,
     ) -> np.ndarray:
         """Load MATLAB reference data from file.
         
@@ -90,45 +315,20 @@ class EffectValidator:
         
         Args:
             reference_path: Path to reference file.
+            dtype: Sample type of the returned array. float32 matches the
+                C++ effects and keeps the comparisons at single precision.
         
         Returns:
-            Reference signal as numpy array.
+            Reference signal as numpy array. Loads are cached per file
+            version, so the array is read-only; copy it before modifying.
         """
-        suffix = reference_path.suffix.lower()
-        
-        if suffix == ".mat":
-            try:
-                from scipy.io import loadmat
-                data = loadmat(reference_path)
-                # Find the signal array (usually named 'y' or 'output')
-                for key in ["y", "output", "signal", "data"]:
-                    if key in data:
-                        return np.array(data[key]).flatten().astype(np.float32)
-                # Return first non-metadata array
-                for key, value in data.items():
-                    if not key.startswith("__"):
-                        return np.array(value).flatten().astype(np.float32)
-            except ImportError:
-                raise ImportError("scipy required for .mat file support")
-        
-        elif suffix == ".npy":
-            return np.load(reference_path).astype(np.float32)
-        
-        elif suffix == ".wav":
-            try:
-                import soundfile as sf
-                data, _ = sf.read(reference_path, dtype="float32")
-                if data.ndim > 1:
-                    data = data[:, 0]  # Take first channel
-                return data
-            except ImportError:
-                raise ImportError("soundfile required for .wav file support")
-        
-        elif suffix == ".csv":
-            return np.loadtxt(reference_path, delimiter=",", dtype=np.float32)
-        
-        else:
-            raise ValueError(f"Unsupported reference file format: {suffix}")
+        # Absolute, so a relative path used from two working directories
+        # does not share one cache entry
+        path = reference_path.resolve()
+        stat = path.stat()
+        return _load_reference_cached(
+            str(path), stat.st_mtime_ns, stat.st_size, np.dtype(dtype)
+        )
     
     def validate(
         self,
@@ -153,29 +353,57 @@ class EffectValidator:
         cpp = cpp_output[:min_len]
         ref = matlab_reference[:min_len]
         
-        # Compute error
-        error = cpp - ref
+        stats = None
+        if self.early_exit and not self.jit and min_len:
+            stats = _certain_pass_stats(cpp, ref)
+        
+        if stats is not None:
+            result = self._build_result(effect_name, cpp, ref, tier, stats)
+            result.details["early_exit"] = True
+        else:
+            # Error and signal statistics (a single pass with jit)
+            stats = _effect_stats(cpp, ref, self.jit)
+            result = self._build_result(effect_name, cpp, ref, tier, stats)
+        
+        if self.verbose:
+            self._print_result(result)
+        
+        return result
+    
+    def _build_result(
+        self,
+        effect_name: str,
+        cpp: np.ndarray,
+        ref: np.ndarray,
+        tier: ToleranceTier,
+        stats: tuple[float, float, float, float, float, float, float, float],
+    ) -> ValidationResult:
+        """Derive metrics and pass/fail from the statistics of cpp against ref."""
+        (
+            max_error,
+            mean_error,
+            std_cpp,
+            std_ref,
+            correlation,
+            signal_power,
+            noise_power,
+            ref_peak,
+        ) = stats
         
         # Convert to dB (avoid log of zero)
         epsilon = 1e-10
         
         # Maximum absolute error in dB
-        max_error = np.max(np.abs(error))
-        max_error_db = 20 * np.log10(max_error + epsilon) if max_error > 0 else -100
+        max_error_db = _amplitude_db(max_error, epsilon)
         
         # Mean absolute error in dB
-        mean_error = np.mean(np.abs(error))
-        mean_error_db = 20 * np.log10(mean_error + epsilon) if mean_error > 0 else -100
+        mean_error_db = _amplitude_db(mean_error, epsilon)
         
         # Correlation coefficient
-        if np.std(cpp) > 0 and np.std(ref) > 0:
-            correlation = np.corrcoef(cpp, ref)[0, 1]
-        else:
+        if not (std_cpp > 0 and std_ref > 0):
             correlation = 1.0 if np.allclose(cpp, ref) else 0.0
         
         # Signal-to-Noise Ratio
-        signal_power = np.mean(ref ** 2)
-        noise_power = np.mean(error ** 2)
         if noise_power > 0:
             snr_db = 10 * np.log10(signal_power / noise_power)
         else:
@@ -183,9 +411,8 @@ class EffectValidator:
         
         # Determine pass/fail
         # Use peak error relative to signal for dB comparison
-        ref_peak = np.max(np.abs(ref))
         if ref_peak > epsilon:
-            relative_error_db = 20 * np.log10(max_error / ref_peak + epsilon)
+            relative_error_db = 20 * math.log10(max_error / ref_peak + epsilon)
         else:
             relative_error_db = -100
         
@@ -195,7 +422,7 @@ class EffectValidator:
         if correlation > 0.99 and snr_db > 40:
             passed = True
         
-        result = ValidationResult(
+        return ValidationResult(
             effect_name=effect_name,
             tier=tier,
             passed=passed,
@@ -203,25 +430,28 @@ class EffectValidator:
             mean_error_db=mean_error_db,
             correlation=correlation,
             snr_db=snr_db,
-            samples_compared=min_len,
+            samples_compared=len(cpp),
             details={
                 "relative_error_db": relative_error_db,
                 "ref_peak": float(ref_peak),
                 "max_abs_error": float(max_error),
             },
         )
-        
-        if self.verbose:
-            self._print_result(result)
-        
-        return result
     
     def _print_result(self, result: ValidationResult) -> None:
         """Print validation result to console."""
-        if RICH_AVAILABLE and self.console:
+        try:
+            from rich import table as rich_table
+            from rich.console import Console
+        except ImportError:
+            rich_table = None
+        
+        if rich_table is not None:
+            if self.console is None:
+                self.console = Console()
             status = "[green]✓ PASSED[/green]" if result.passed else "[red]✗ FAILED[/red]"
             
-            table = Table(title=f"Validation: {result.effect_name}")
+            table = rich_table.Table(title=f"Validation: {result.effect_name}")
             table.add_column("Metric", style="cyan")
             table.add_column("Value", justify="right")
             
@@ -259,18 +489,44 @@ class EffectValidator:
         Returns:
             List of ValidationResults.
         """
-        results = []
-        for effect in effects:
-            tier = effect.get("tier", ToleranceTier.STANDARD)
-            result = self.validate(
-                effect_name=effect["name"],
-                cpp_output=effect["cpp_output"],
-                matlab_reference=effect["matlab_reference"],
-                tier=tier,
-            )
-            results.append(result)
+        results: list[ValidationResult | None] = [None] * len(effects)
         
-        return results
+        # Without jit, effects of equal length share one stacked NumPy call
+        by_length: dict[int, list[int]] = {}
+        if not self.jit:
+            for i, effect in enumerate(effects):
+                length = min(len(effect["cpp_output"]), len(effect["matlab_reference"]))
+                if length:
+                    by_length.setdefault(length, []).append(i)
+        
+        for length, indices in by_length.items():
+            if len(indices) < 2:
+                continue
+            cpps = [effects[i]["cpp_output"][:length] for i in indices]
+            refs = [effects[i]["matlab_reference"][:length] for i in indices]
+            batch_stats = _batch_effect_stats(np.stack(cpps), np.stack(refs))
+            for row, i in enumerate(indices):
+                results[i] = self._build_result(
+                    effects[i]["name"],
+                    cpps[row],
+                    refs[row],
+                    effects[i].get("tier", ToleranceTier.STANDARD),
+                    tuple(column[row] for column in batch_stats),
+                )
+        
+        for i, effect in enumerate(effects):
+            if results[i] is None:
+                tier = effect.get("tier", ToleranceTier.STANDARD)
+                results[i] = self.validate(
+                    effect_name=effect["name"],
+                    cpp_output=effect["cpp_output"],
+                    matlab_reference=effect["matlab_reference"],
+                    tier=tier,
+                )
+            elif self.verbose:
+                self._print_result(results[i])
+        
+        return results  # type: ignore[return-value]
     
     def generate_report(
         self,
@@ -321,6 +577,8 @@ EFFECT_TIERS = {
 
 def main() -> int:
     """CLI entry point."""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Validate C++ DSP effects against MATLAB reference"
     )
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import dataclasses
+import itertools
+from collections import defaultdict
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Sequence
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationErrorDetail:
     """Detailed information about a single validation error."""
 
@@ -15,7 +18,8 @@ class ValidationErrorDetail:
     field: Optional[str] = None
     path: Optional[str] = None
     value: Any = None
-    context: Dict[str, Any] = field(default_factory=dict)
+    # ``field`` is rebound by the attribute above within this class body
+    context: Dict[str, Any] = dataclasses.field(default_factory=dict)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation."""
@@ -122,25 +126,21 @@ class ValidationErrorCollection(Exception):
     
     def is_empty(self) -> bool:
         """Check if collection has no errors."""
-        return len(self._errors) == 0
+        return not self._errors
     
     def by_field(self) -> Dict[Optional[str], List[ValidationError]]:
         """Group errors by field."""
-        result: Dict[Optional[str], List[ValidationError]] = {}
+        result: Dict[Optional[str], List[ValidationError]] = defaultdict(list)
         for error in self._errors:
-            if error.field not in result:
-                result[error.field] = []
             result[error.field].append(error)
-        return result
+        return dict(result)
     
     def by_code(self) -> Dict[str, List[ValidationError]]:
         """Group errors by code."""
-        result: Dict[str, List[ValidationError]] = {}
+        result: Dict[str, List[ValidationError]] = defaultdict(list)
         for error in self._errors:
-            if error.code not in result:
-                result[error.code] = []
             result[error.code].append(error)
-        return result
+        return dict(result)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation."""
@@ -162,17 +162,16 @@ class ValidationErrorCollection(Exception):
         return iter(self._errors)
     
     def __bool__(self) -> bool:
-        return not self.is_empty()
+        return bool(self._errors)
     
     def __str__(self) -> str:
         if not self._errors:
             return "No validation errors"
         
-        lines = [f"{self.message} ({self.error_count} total):"]
-        for i, error in enumerate(self._errors, 1):
-            lines.append(f"  {i}. {error}")
-        
-        return "\n".join(lines)
+        header = f"{self.message} ({self.error_count} total):"
+        return "\n".join(
+            itertools.chain((header,), (f"  {i}. {e}" for i, e in enumerate(self._errors, 1)))
+        )
 
 
 class AggregatedValidationError(ValidationErrorCollection):
@@ -208,13 +207,10 @@ class AggregatedValidationError(ValidationErrorCollection):
     
     def by_path(self) -> Dict[str, List[ValidationError]]:
         """Group errors by path."""
-        result: Dict[str, List[ValidationError]] = {}
+        result: Dict[str, List[ValidationError]] = defaultdict(list)
         for error in self._errors:
-            path = error.path or "<root>"
-            if path not in result:
-                result[path] = []
-            result[path].append(error)
-        return result
+            result[error.path or "<root>"].append(error)
+        return dict(result)
     
     def get_nested_structure(self) -> Dict[str, Any]:
         """Get errors organized in nested structure matching field paths."""